@@ -16,6 +16,7 @@
 from __future__ import annotations
 
 import csv
+import functools
 import json
 import re
 from collections import defaultdict
@@ -235,9 +236,16 @@ def score_post(body: str) -> int:
 VADER = SentimentIntensityAnalyzer()
 
 
+@functools.lru_cache(maxsize=4096)
+def _polarity_scores(body: str) -> Dict[str, float]:
+    # VADER is pure Python and deterministic per text; short bodies
+    # ("lol", "same", emoji-only) repeat a lot, so memoize by body.
+    return VADER.polarity_scores(body)
+
+
 def get_sentiment(body: str) -> Dict[str, float]:
     """Compute VADER sentiment scores. Returns dict with compound, pos, neg, neu."""
-    scores = VADER.polarity_scores(body or "")
+    scores = _polarity_scores(body or "")
     return {
         "sentiment_compound": scores.get("compound", 0.0),
         "sentiment_pos": scores.get("pos", 0.0),
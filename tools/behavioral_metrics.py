@@ -32,14 +32,8 @@ def fail(msg: str) -> None:
 def get_file_sha256(path: Path) -> str:
     if not path.exists():
         fail(f"Input file not found: {path}")
-    sha256 = hashlib.sha256()
     with path.open("rb") as f:
-        while True:
-            chunk = f.read(65536)
-            if not chunk:
-                break
-            sha256.update(chunk)
-    return f"sha256:{sha256.hexdigest()}"
+        return f"sha256:{hashlib.file_digest(f, 'sha256').hexdigest()}"
 
 def safe_mean(values: List[float]) -> Optional[float]:
     if not values:
@@ -18,11 +18,8 @@ def fail(msg: str) -> None:
 
 
 def sha256_file_bytes(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return "sha256:" + h.hexdigest()
+        return "sha256:" + hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def read_jsonl(path: Path) -> List[Dict[str, Any]]:
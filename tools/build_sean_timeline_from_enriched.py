@@ -1,4 +1,5 @@
 import json
+import operator
 import pathlib
 import csv
 from datetime import datetime
@@ -23,7 +24,7 @@ if INP.exists():
             row["_created_dt"] = dt.isoformat()
             rows.append(row)
 
-rows.sort(key=lambda r: r["_created_dt"])
+rows.sort(key=operator.itemgetter("_created_dt"))
 
 OUT_JSON.write_text(json.dumps(rows, indent=2, ensure_ascii=False), encoding="utf-8")
 
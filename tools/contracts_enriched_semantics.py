@@ -11,24 +11,34 @@ def main() -> None:
     if not ENRICHED.exists():
         fail(f"Missing enriched file: {ENRICHED}")
 
-    rows = [json.loads(l) for l in ENRICHED.read_text(encoding="utf-8").splitlines() if l.strip()]
-    if not rows:
+    # Stream rows: only the per-kind counts are kept, never the whole file.
+    required = {"joined_item_type", "thread_permalink", "thread_primary_topic", "topics", "source_index"}
+    kind_counts: dict = {}
+    n = 0
+    with ENRICHED.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            n += 1
+            r = json.loads(line)
+            if not isinstance(r, dict):
+                fail(f"Row {n} is not an object")
+            missing = [k for k in required if k not in r]
+            if missing:
+                fail(f"Row {n} missing required keys: {missing}")
+            kind = r.get("joined_item_type")
+            kind_counts[kind] = kind_counts.get(kind, 0) + 1
+
+    if not n:
         fail("Enriched JSONL is empty")
 
-    required = {"joined_item_type", "thread_permalink", "thread_primary_topic", "topics", "source_index"}
-    for i, r in enumerate(rows, start=1):
-        if not isinstance(r, dict):
-            fail(f"Row {i} is not an object")
-        missing = [k for k in required if k not in r]
-        if missing:
-            fail(f"Row {i} missing required keys: {missing}")
-
-    kinds = {r.get("joined_item_type") for r in rows}
+    kinds = set(kind_counts)
     if not kinds.issubset({"post", "comment"}):
         fail(f"Invalid joined_item_type values found: {sorted(kinds)}")
 
     print("[OK] enriched semantics contract")
-    print(f"  rows: {len(rows)}")
+    print(f"  rows: {n}")
+    print(f"  posts: {kind_counts.get('post', 0)}  comments: {kind_counts.get('comment', 0)}")
     print(f"  joined_item_type: {sorted(kinds)}")
 
 if __name__ == "__main__":
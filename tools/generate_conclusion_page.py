@@ -5,6 +5,13 @@ import html
 from pathlib import Path
 from collections import Counter
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used as a drop-in fallback
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 ENRICHED = Path("fb_extract_out/sean_context_enriched.v2.jsonl")
 
 # Existing metrics (already generated by your pipeline)
@@ -34,11 +41,13 @@ def load_jsonl(path: Path) -> list[dict]:
     if not path.exists():
         fail(f"Missing required JSONL: {path}")
     rows = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        rows.append(json.loads(line))
+    # Stream byte lines: no whole-file str + list of lines, and no splitting
+    # on U+2028/U+0085, which ensure_ascii=False JSON can carry unescaped.
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rows.append(_loads(line))
     return rows
 
 def preview(s: str, n: int = 240) -> str:
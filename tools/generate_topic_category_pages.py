@@ -4,6 +4,13 @@ import html
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used as a drop-in fallback
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 ENRICHED = Path("fb_extract_out/sean_context_enriched.v2.jsonl")
 OUT_DIR = Path("docs/topics")
 
@@ -36,11 +43,13 @@ def load_jsonl(path: Path) -> list[dict]:
     if not path.exists():
         fail(f"Missing enriched file: {path}")
     rows: list[dict] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        rows.append(json.loads(line))
+    # Stream byte lines: no whole-file str + list of lines, and no splitting
+    # on U+2028/U+0085, which ensure_ascii=False JSON can carry unescaped.
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rows.append(_loads(line))
     return rows
 
 
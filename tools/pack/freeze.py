@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import shutil
 from dataclasses import dataclass
@@ -10,6 +9,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, List, Tuple
 
+from hashing import sha256_file
+
 
 PACK_VERSION = "1.0"
 
@@ -46,17 +47,6 @@ class FileEntry:
     sha256: str
 
 
-def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
-
-
 def _iter_globbed_files(repo_root: Path, patterns: List[str]) -> Iterable[Path]:
     seen: set[Path] = set()
     for pat in patterns:
@@ -132,7 +122,7 @@ def main() -> int:
 
     for rel, p in rel_files:
         size = p.stat().st_size
-        digest = _sha256_file(p)
+        digest = sha256_file(p)
         entries.append(FileEntry(relpath=rel, bytes=size, sha256=digest))
         total_bytes += size
 
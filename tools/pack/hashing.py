@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+
+def sha256_file(path: Path) -> str:
+    # hashlib.file_digest runs the read/update loop in C
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
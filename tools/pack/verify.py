@@ -2,21 +2,11 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 from pathlib import Path
 from typing import Dict
 
-
-def _sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+from hashing import sha256_file
 
 
 def parse_args() -> argparse.Namespace:
@@ -64,7 +54,7 @@ def main() -> int:
             print(f"[FAIL] Size mismatch: {rel} (expected {meta['bytes']}, got {size})")
             errors += 1
 
-        digest = _sha256_file(path)
+        digest = sha256_file(path)
         if digest != meta["sha256"]:
             print(f"[FAIL] Hash mismatch: {rel}")
             errors += 1
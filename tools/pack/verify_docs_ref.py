@@ -5,18 +5,24 @@ import argparse
 import hashlib
 import json
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
+from hashing import sha256_file
 
-def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+
+def load_verify_cache(cache_path: Path) -> Optional[dict]:
+    if not cache_path.exists():
+        return None
+    try:
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return cache if isinstance(cache, dict) else None
+
+
+def stat_fingerprint(path: Path) -> list:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
 
 
 def parse_args() -> argparse.Namespace:
@@ -24,6 +30,12 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--ref", default="docs/pack_ref.json", help="Path to pack ref JSON in repo.")
     p.add_argument("--docs-root", default="docs", help="Docs root directory in repo.")
     p.add_argument("--strict", action="store_true", help="Fail if extra docs files exist not listed in ref.")
+    p.add_argument(
+        "--cache",
+        default=".verify_cache",
+        help="Cache file keyed by the sha256 of the ref file; files whose size/mtime are unchanged skip re-hashing.",
+    )
+    p.add_argument("--no-cache", action="store_true", help="Always hash every docs file.")
     return p.parse_args()
 
 
@@ -39,7 +51,9 @@ def main() -> int:
         print(f"[FAIL] Missing docs root: {docs_root}")
         return 1
 
-    ref = json.loads(ref_path.read_text(encoding="utf-8"))
+    ref_bytes = ref_path.read_bytes()
+    ref_digest = hashlib.sha256(ref_bytes).hexdigest()
+    ref = json.loads(ref_bytes.decode("utf-8"))
     files = ref.get("files", [])
     if not isinstance(files, list) or not files:
         print("[FAIL] Ref JSON has no files[] entries.")
@@ -50,7 +64,18 @@ def main() -> int:
         rel = Path(e["relpath"])
         expected[rel] = e
 
+    # cache-of-cache: when pack_ref.json is byte-identical to the last verified
+    # run, a file whose (size, mtime) is unchanged does not need re-hashing.
+    cache_path = Path(args.cache).resolve()
+    cached_files: Dict[str, list] = {}
+    if not args.no_cache:
+        cache = load_verify_cache(cache_path)
+        if cache and cache.get("ref_sha256") == ref_digest:
+            cached_files = cache.get("files", {})
+
     errors = 0
+    verified: Dict[str, list] = {}
+    skipped = 0
 
     # verify expected files
     for rel, meta in expected.items():
@@ -60,15 +85,26 @@ def main() -> int:
             errors += 1
             continue
 
-        size = path.stat().st_size
+        fp = stat_fingerprint(path)
+        size = fp[0]
         if size != meta["bytes"]:
             print(f"[FAIL] Size mismatch: {rel} (expected {meta['bytes']}, got {size})")
             errors += 1
+            continue
+
+        key = rel.as_posix()
+        if cached_files.get(key) == fp:
+            verified[key] = fp
+            skipped += 1
+            continue
 
         digest = sha256_file(path)
         if digest != meta["sha256"]:
             print(f"[FAIL] Hash mismatch: {rel}")
             errors += 1
+            continue
+
+        verified[key] = fp
 
     # strict mode: fail if extra files in docs not listed
     if args.strict:
@@ -89,8 +125,15 @@ def main() -> int:
         print(f"[i] Verification failed: {errors} error(s)")
         return 1
 
+    if not args.no_cache:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_text = json.dumps({"ref_sha256": ref_digest, "files": verified}, indent=2, sort_keys=True) + "\n"
+        cache_path.write_text(cache_text, encoding="utf-8", newline="\n")
+
     print("[OK] docs/ matches docs/pack_ref.json")
     print(f"[OK] files verified: {len(expected)}")
+    if skipped:
+        print(f"[i] hash skipped (cache hit): {skipped}")
     return 0
 
 
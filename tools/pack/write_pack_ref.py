@@ -2,20 +2,10 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 from pathlib import Path
 
-
-def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        while True:
-            chunk = f.read(chunk_size)
-            if not chunk:
-                break
-            h.update(chunk)
-    return h.hexdigest()
+from hashing import sha256_file
 
 
 def parse_args() -> argparse.Namespace:
@@ -62,9 +52,11 @@ def main() -> int:
         "files": entries,
     }
 
-    # IMPORTANT: write with LF newlines for cross-platform determinism
+    # IMPORTANT: write with LF newlines, sorted keys and fixed separators so the
+    # file is byte-identical across platforms/Python versions (verify_docs_ref
+    # hashes pack_ref.json itself as a cache key).
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    text = json.dumps(ref, indent=2).replace("\r\n", "\n").replace("\r", "\n") + "\n"
+    text = json.dumps(ref, indent=2, sort_keys=True, separators=(",", ": ")) + "\n"
     out_path.write_text(text, encoding="utf-8", newline="\n")
 
     print(f"[i] Wrote: {out_path} ({len(entries)} files)")
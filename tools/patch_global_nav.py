@@ -13,19 +13,10 @@ def fail(msg: str) -> None:
     raise SystemExit("[FAIL] " + msg)
 
 
-def _indent_block(block: str, indent: str) -> str:
-    # Prefix each non-empty line with the original indentation.
-    lines = block.splitlines()
-    out = []
-    for ln in lines:
-        out.append((indent + ln) if ln.strip() else ln)
-    return "\n".join(out)
-
-
-def build_nav(active: str, topics_active: bool = False) -> str:
+def build_nav(active: str, topics_active: bool = False, indent: str = "") -> str:
     """
-    Returns a nav block starting at column 0 (no leading indentation).
-    Caller re-indents to match file context.
+    Returns a nav block with every line prefixed by `indent`
+    (the indentation of the <nav> line in the file being patched).
     """
     active_map: Dict[str, str] = {
         "home": ' class="active"',
@@ -41,39 +32,36 @@ def build_nav(active: str, topics_active: bool = False) -> str:
     topics_toggle = ' class="active"' if topics_active else ""
 
     # Canonical nav: single brand anchor, consistent order, includes Signals.
-    return f"""<nav>
-<a href="index.html" class="brand">Context Reviewer</a>
-<a href="index.html"{a("home")}>Home</a>
-<a href="report.html"{a("report")}>Report</a>
-<div class="dropdown">
-    <a href="#"{topics_toggle}>Topics ▾</a>
-    <div class="dropdown-content">
-        <a href="topics/israel.html">Israel / Palestine</a>
-        <a href="topics/race.html">Race & Identity</a>
-        <a href="topics/religion.html">Religion</a>
-    </div>
-</div>
-<a href="contradictions.html"{a("contradictions")}>Contradictions</a>
-<a href="conclusion.html"{a("conclusion")}>Conclusion</a>
-<a href="signals.html"{a("signals")}>Signals</a>
-</nav>"""
+    return f"""{indent}<nav>
+{indent}<a href="index.html" class="brand">Context Reviewer</a>
+{indent}<a href="index.html"{a("home")}>Home</a>
+{indent}<a href="report.html"{a("report")}>Report</a>
+{indent}<div class="dropdown">
+{indent}    <a href="#"{topics_toggle}>Topics ▾</a>
+{indent}    <div class="dropdown-content">
+{indent}        <a href="topics/israel.html">Israel / Palestine</a>
+{indent}        <a href="topics/race.html">Race & Identity</a>
+{indent}        <a href="topics/religion.html">Religion</a>
+{indent}    </div>
+{indent}</div>
+{indent}<a href="contradictions.html"{a("contradictions")}>Contradictions</a>
+{indent}<a href="conclusion.html"{a("conclusion")}>Conclusion</a>
+{indent}<a href="signals.html"{a("signals")}>Signals</a>
+{indent}</nav>"""
 
 
 def patch_html(html: str, active: str, topics_active: bool = False) -> str:
     # Find the nav block with indentation.
-    matches = list(NAV_BLOCK_RE.finditer(html))
-    if len(matches) != 1:
-        fail(f"expected exactly 1 <nav>...</nav> block, found {len(matches)}")
-
-    m = matches[0]
-    indent = m.group("indent")
+    m = NAV_BLOCK_RE.search(html)
+    if m is None:
+        fail("expected exactly 1 <nav>...</nav> block, found 0")
+    if NAV_BLOCK_RE.search(html, m.end()) is not None:
+        fail("expected exactly 1 <nav>...</nav> block, found more than 1")
 
-    nav = build_nav(active=active, topics_active=topics_active)
-    nav_indented = _indent_block(nav, indent)
+    nav = build_nav(active=active, topics_active=topics_active, indent=m["indent"])
 
     # Replace exactly the matched block (no extra blank lines inserted).
-    patched = html[: m.start()] + nav_indented + html[m.end() :]
-    return patched
+    return html[: m.start()] + nav + html[m.end() :]
 
 
 def patch_file(path: Path, active: str, topics_active: bool = False) -> None:
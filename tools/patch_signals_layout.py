@@ -24,6 +24,22 @@ NAV_CANON = """\
     </nav>
 """
 
+# One linear scan yields all three pieces we need, dispatched on m.lastgroup:
+# - head:   zero-width lookahead at \A, so <script>s inside <head> are still scanned
+# - intro:  the first <p> following <h1>Signals</h1>
+# - script: every <script>...</script> block
+_LAYOUT_RE = re.compile(
+    r"\A(?=(?P<head>.*?</head>)\s*<body>)"
+    r"|<h1>\s*Signals\s*</h1>\s*(?P<intro><p[^>]*>.*?</p>)"
+    r"|(?P<script><script\b.*?>.*?</script>)",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# All structural/mount-point markers, found in one pass over the raw bytes.
+_STRUCTURE_MARKERS = (b'<header class="topnav">', b'<main class="container">')
+_MOUNT_MARKERS = (b'id="status"', b'id="signals"')
+_PRESENCE_RE = re.compile(b"|".join(re.escape(m) for m in _STRUCTURE_MARKERS + _MOUNT_MARKERS))
+
 def fail(msg: str) -> None:
     raise SystemExit("[FAIL] " + msg)
 
@@ -31,35 +47,48 @@ def main() -> None:
     if not SRC.exists():
         fail(f"missing {SRC}")
 
-    html = SRC.read_text(encoding="utf-8")
+    data = SRC.read_bytes()
+    present = set(_PRESENCE_RE.findall(data))
 
     # Sanity: ensure we're patching the expected framework-B page
-    if "<header class=\"topnav\">" not in html or "<main class=\"container\">" not in html:
+    if not present.issuperset(_STRUCTURE_MARKERS):
         fail("signals.html does not contain expected <header class=\"topnav\"> + <main class=\"container\"> structure")
 
+    # Status + signals mount points (must exist)
+    if not present.issuperset(_MOUNT_MARKERS):
+        fail('missing required mount points: id="status" and/or id="signals"')
+
+    # Same newline translation read_text() would have applied
+    html = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    # Single pass: <head> boundary, intro paragraph and <script> blocks
+    head = None
+    intro_p = None
+    scripts = []
+    for m in _LAYOUT_RE.finditer(html):
+        kind = m.lastgroup
+        if kind == "script":
+            scripts.append(m.group("script"))
+        elif kind == "intro":
+            if intro_p is None:
+                intro_p = m.group("intro").strip()
+        else:
+            head = m.group("head")
+
     # Keep everything in <head> exactly as-is (including inline <style>)
-    m_head = re.search(r"(?is)\A(.*?</head>)\s*<body>.*\Z", html)
-    if not m_head:
+    if head is None:
         fail("could not isolate </head> boundary")
 
-    head = m_head.group(1)
-
-    # Extract the intro paragraph text from the first panel (keep wording)
-    m_intro = re.search(r'(?is)<h1>\s*Signals\s*</h1>\s*(<p[^>]*>.*?</p>)', html)
-    if not m_intro:
+    # Intro paragraph text from the first panel (keep wording)
+    if intro_p is None:
         fail("could not find Signals intro paragraph (<h1>Signals</h1> ... <p>...)")
-    intro_p = m_intro.group(1).strip()
 
-    # Extract status + signals mount points (must exist)
-    if 'id="status"' not in html or 'id="signals"' not in html:
-        fail('missing required mount points: id="status" and/or id="signals"')
     # Rebuild a minimal, canonical content block using those same ids/classes.
     # (We intentionally do not attempt to preserve the old <section class="panel"> wrappers.)
     status_div = '<div id="status" class="subtle mono">Loading signals_index.json…</div>'
     signals_div = '<div id="signals"></div>'
 
-    # Extract the entire <script>...</script> block(s) from the original (keep JS logic unchanged)
-    scripts = re.findall(r"(?is)<script\b.*?>.*?</script>", html)
+    # Preserve the entire <script>...</script> block(s) from the original (keep JS logic unchanged)
     if not scripts:
         fail("no <script> blocks found to preserve")
     scripts_blob = "\n\n".join(s.strip() for s in scripts)
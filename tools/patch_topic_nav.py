@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import re
 from pathlib import Path
 from typing import List, Tuple
@@ -11,6 +12,10 @@ TOPICS: List[Tuple[str, str]] = [
     ("religion.html", "Religion"),
 ]
 
+# Topic links are fixed, so the dropdown body is assembled once at import;
+# build_nav only marks the active link and applies the indentation.
+_TOPIC_LINKS = "\n".join(f'{{indent}}        <a href="{href}">{label}</a>' for href, label in TOPICS)
+
 NAV_BLOCK_RE = re.compile(r"(?ms)^(?P<indent>[ \t]*)<nav>\s*.*?\s*</nav>\s*$")
 
 
@@ -18,51 +23,42 @@ def fail(msg: str) -> None:
     raise SystemExit("[FAIL] " + msg)
 
 
-def _indent_block(block: str, indent: str) -> str:
-    lines = block.splitlines()
-    out = []
-    for ln in lines:
-        out.append((indent + ln) if ln.strip() else ln)
-    return "\n".join(out)
-
-
-def build_nav(active_topic_href: str) -> str:
-    links = []
-    for href, label in TOPICS:
-        cls = ' class="active"' if href == active_topic_href else ""
-        links.append(f'        <a href="{href}"{cls}>{label}</a>')
-    topic_links_html = "\n".join(links)
+@functools.lru_cache(maxsize=8)
+def build_nav(active_topic_href: str, indent: str = "") -> str:
+    """
+    Returns the topic-page nav block with every line prefixed by `indent`
+    (the indentation of the <nav> line in the file being patched).
+    """
+    active = f'<a href="{active_topic_href}">'
+    topic_links_html = _TOPIC_LINKS.replace(active, active[:-1] + ' class="active">', 1).replace("{indent}", indent)
 
     # Note: relative paths from docs/topics/*.html
-    return f"""<nav>
-<a href="../index.html" class="brand">Context Reviewer</a>
-<a href="../index.html">Home</a>
-<a href="../report.html">Report</a>
-<div class="dropdown">
-    <a href="#" class="active">Topics ▾</a>
-    <div class="dropdown-content">
+    return f"""{indent}<nav>
+{indent}<a href="../index.html" class="brand">Context Reviewer</a>
+{indent}<a href="../index.html">Home</a>
+{indent}<a href="../report.html">Report</a>
+{indent}<div class="dropdown">
+{indent}    <a href="#" class="active">Topics ▾</a>
+{indent}    <div class="dropdown-content">
 {topic_links_html}
-    </div>
-</div>
-<a href="../contradictions.html">Contradictions</a>
-<a href="../conclusion.html">Conclusion</a>
-<a href="../signals.html">Signals</a>
-</nav>"""
+{indent}    </div>
+{indent}</div>
+{indent}<a href="../contradictions.html">Contradictions</a>
+{indent}<a href="../conclusion.html">Conclusion</a>
+{indent}<a href="../signals.html">Signals</a>
+{indent}</nav>"""
 
 
 def patch_html(html: str, active_topic_href: str) -> str:
-    matches = list(NAV_BLOCK_RE.finditer(html))
-    if len(matches) != 1:
-        fail(f"expected exactly 1 <nav>...</nav> block, found {len(matches)}")
-
-    m = matches[0]
-    indent = m.group("indent")
-
-    nav = build_nav(active_topic_href)
-    nav_indented = _indent_block(nav, indent)
-
-    patched = html[: m.start()] + nav_indented + html[m.end() :]
-    return patched
+    it = NAV_BLOCK_RE.finditer(html)
+    m = next(it, None)
+    extra = next(it, None)
+    if m is None or extra is not None:
+        found = "0" if m is None else "more than 1"
+        fail(f"expected exactly 1 <nav>...</nav> block, found {found}")
+
+    nav = build_nav(active_topic_href, indent=m["indent"])
+    return html[: m.start()] + nav + html[m.end() :]
 
 
 def patch_one(path: Path) -> None:
@@ -3,12 +3,21 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import multiprocessing
+import os
+import runpy
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json produces the same bytes, just slower
+    orjson = None
+
 
 FB_OUT = Path("fb_extract_out")
 RUNS = FB_OUT / "runs"
@@ -21,6 +30,18 @@ CANON_COMMENTS = FB_OUT / "comments_normalized.jsonl"
 LEGACY_POSTS = FB_OUT / "posts_normalized_sean.jsonl"
 LEGACY_COMMENTS = FB_OUT / "comments_normalized_sean.jsonl"
 
+# Phase 1 canonical output names
+TIMELINE_JSON = FB_OUT / "sean_timeline.json"
+TOPICS_CSV = FB_OUT / "sean_topics.csv"
+ENRICHED_JSONL = FB_OUT / "sean_context_enriched.v2.jsonl"
+SIGNALS_DIR = FB_OUT / "signals"
+STATS_JSON = FB_OUT / "sean_stats.json"
+DOCS_DIR = Path("docs")
+
+RUN_MANIFEST_SCHEMA = Path("schemas") / "run_manifest-1.0.schema.json"
+RUN_MANIFEST_PATH = FB_OUT / "run_manifest.json"
+SHA256_CACHE = FB_OUT / ".sha256_cache.json"
+
 
 def fail(msg: str) -> None:
     raise SystemExit("[FAIL] " + msg)
@@ -32,24 +53,240 @@ def run(cmd: list[str]) -> None:
     subprocess.check_call(cmd)
 
 
-def _sha256_file(p: Path) -> str:
-    h = hashlib.sha256()
-    with p.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+def run_script(script: str) -> None:
+    """
+    Execute a pipeline script in this interpreter (runpy, as __main__) to skip
+    per-step interpreter startup and re-imports. Behaves like
+    `python <script>`: argv/sys.path[0] are set for the script, and a non-zero
+    SystemExit is surfaced as CalledProcessError so callers see the same
+    failure type as run().
+    """
+    cmd = [sys.executable, script]
+    print("[RUN] " + " ".join(cmd))
+    saved_argv = sys.argv
+    saved_path = sys.path[:]
+    sys.argv = [script]
+    sys.path.insert(0, str(Path(script).resolve().parent))
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or e.code == 0:
+            return
+        if not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+        raise subprocess.CalledProcessError(e.code if isinstance(e.code, int) else 1, cmd) from None
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        sys.stdout.flush()
+
+
+def run_parallel(cmds: list[list[str]]) -> None:
+    """
+    Run independent steps concurrently. Each step's output is captured and
+    replayed in submission order so logs stay deterministic; the first
+    failing step (in that order) raises like run() would.
+    """
+    for cmd in cmds:
+        print("[RUN] " + " ".join(str(x) for x in cmd))
+    workers = min(len(cmds), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        procs = list(ex.map(lambda c: subprocess.run(c, stdout=subprocess.PIPE, stderr=subprocess.STDOUT), cmds))
+    sys.stdout.flush()
+    for cmd, proc in zip(cmds, procs):
+        sys.stdout.buffer.write(proc.stdout)
+        sys.stdout.buffer.flush()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+# Parsed signal input, inherited copy-on-write by forked signal workers.
+_SIGNAL_ITEMS: list = []
+
+
+def _run_signal_worker(spec: Path, out_dir: Path) -> Path:
+    import run_signal
+
+    return run_signal.write_signal(spec, _SIGNAL_ITEMS, out_dir)
+
+
+def run_signals(specs: list[Path], signal_input: Path, out_dir: Path) -> None:
+    """
+    Evaluate every signal spec against one parse of signal_input, fanning
+    specs out over forked worker processes. Where fork is unavailable
+    (Windows) fall back to one run_signal.py subprocess for all specs.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        run([sys.executable, "tools/run_signal.py", *[str(s) for s in specs], str(signal_input), str(out_dir)])
+        return
+
+    import run_signal
+
+    print(f"[RUN] run_signal (in-process, {len(specs)} specs): {signal_input}")
+    global _SIGNAL_ITEMS
+    _SIGNAL_ITEMS = run_signal.load_jsonl(signal_input)
+    try:
+        workers = min(len(specs), os.cpu_count() or 1)
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as ex:
+            for out_path in ex.map(_run_signal_worker, specs, [out_dir] * len(specs)):
+                print(f"Wrote: {out_path}")
+    finally:
+        _SIGNAL_ITEMS = []
+
+
+def _stat_or_none(p: Path) -> os.stat_result | None:
+    # One stat() syscall that doubles as an exists() check.
+    try:
+        return p.stat()
+    except OSError:
+        return None
+
+
+def _load_sha256_cache() -> dict:
+    try:
+        cache = json.loads(SHA256_CACHE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_sha256_cache(cache: dict) -> None:
+    # tmp + os.replace: a crash mid-write never leaves a torn cache behind.
+    tmp = SHA256_CACHE.with_name(SHA256_CACHE.name + ".tmp")
+    tmp.write_text(json.dumps(cache, sort_keys=True, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, SHA256_CACHE)
+
+
+def _sha256_file(p: Path, st: os.stat_result | None = None) -> str:
+    # Cached across runs in SHA256_CACHE by (resolved path, size, mtime_ns):
+    # unchanged inputs are not re-hashed on reruns.
+    # Callers that already stat()ed p can pass st to skip another syscall.
+    if st is None:
+        st = p.stat()
+    key = str(p.resolve())
+    cache = _load_sha256_cache()
+    entry = cache.get(key)
+    if (
+        isinstance(entry, dict)
+        and entry.get("size") == st.st_size
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and isinstance(entry.get("digest"), str)
+    ):
+        return entry["digest"]
+
+    digest = _sha256_file_uncached(key)
+    cache[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "digest": digest}
+    _save_sha256_cache(cache)
+    return digest
+
+
+def _sha256_file_uncached(path: str) -> str:
+    # hashlib.file_digest runs the read/update loop in C; unbuffered since it
+    # does its own large reads.
+    with open(path, "rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _write_json(p: Path, obj: dict) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
-    data = json.dumps(obj, ensure_ascii=False, sort_keys=True, indent=2)
-    p.write_text(data + "\n", encoding="utf-8")
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n"
+    else:
+        data = (json.dumps(obj, ensure_ascii=False, sort_keys=True, indent=2) + "\n").encode("utf-8")
+    p.write_bytes(data)
+
+
+def copy_file(src, dst) -> str:
+    """
+    shutil.copy2 drop-in that copies in-kernel via os.copy_file_range
+    (reflink on CoW filesystems) instead of through userspace buffers.
+
+    Snapshots deliberately do NOT use hardlinks: docs/ and fb_extract_out/
+    files are rewritten in place by later runs, which would mutate any
+    linked snapshot.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(src, dst)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    try:
+        with open(src, "rb") as fi, open(dst, "wb") as fo:
+            remaining = os.fstat(fi.fileno()).st_size
+            # st_size == 0 may hide content (procfs-style files); a premature
+            # 0 from copy_file_range means the file shrank or st_size lied.
+            # Either way the kernel copy is not trusted: never keep a short copy.
+            short = remaining == 0
+            while remaining > 0:
+                n = os.copy_file_range(fi.fileno(), fo.fileno(), remaining)
+                if n == 0:
+                    short = True
+                    break
+                remaining -= n
+    except OSError:
+        # EXDEV/ENOSYS/EINVAL on older kernels or special filesystems
+        return shutil.copy2(src, dst)
+    if short:
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """
+    Make dst a hardlink to src (no bytes copied), falling back to copy_file
+    across filesystems or where links are unsupported.
+
+    dst is swapped in via os.replace rather than written through, so an
+    existing dst inode is never modified. Only used for files that live for
+    one run (canonical remaps, legacy aliases); they are removed or restored
+    from a real copy in main()'s cleanup.
+    """
+    tmp = dst.with_name(dst.name + ".link-tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        copy_file(src, tmp)
+    os.replace(tmp, dst)
 
 
 def copy_tree(src: Path, dst: Path) -> None:
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst)
+    """
+    Make dst an exact mirror of src in one os.scandir pass per directory:
+    files whose (size, mtime_ns) already match are skipped (copy_file
+    preserves mtime), changed or new files are copied, and anything in dst
+    that is no longer in src is removed.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    with os.scandir(src) as it:
+        src_entries = {e.name: e for e in it}
+    with os.scandir(dst) as it:
+        dst_entries = {e.name: e for e in it}
+
+    for name, d in list(dst_entries.items()):
+        s = src_entries.get(name)
+        d_is_dir = d.is_dir(follow_symlinks=False)
+        if s is not None and s.is_dir() == d_is_dir:
+            continue
+        if d_is_dir:
+            shutil.rmtree(d.path)
+        else:
+            os.unlink(d.path)
+        del dst_entries[name]
+
+    for name, s in src_entries.items():
+        target = dst / name
+        if s.is_dir():
+            copy_tree(Path(s.path), target)
+            continue
+        d = dst_entries.get(name)
+        if d is not None:
+            ss, ds = s.stat(), d.stat()
+            if ss.st_size == ds.st_size and ss.st_mtime_ns == ds.st_mtime_ns:
+                continue
+        copy_file(s.path, target)
+    shutil.copystat(src, dst)
 
 
 def backup_if_exists(p: Path, backup_dir: Path) -> Path | None:
@@ -66,6 +303,9 @@ def restore_backup(backup: Path | None, target: Path) -> None:
         return
     if backup.exists():
         target.parent.mkdir(parents=True, exist_ok=True)
+        # target may be a hardlink to the user's input (link_or_copy):
+        # replace the entry instead of truncating and writing through it.
+        target.unlink(missing_ok=True)
         shutil.copy2(backup, target)
 
 
@@ -74,59 +314,60 @@ def _emit_run_manifest(run_id: str, subject_label: str, posts_src: Path, comment
     Emit fb_extract_out/run_manifest.json that conforms EXACTLY to schemas/run_manifest-1.0.schema.json.
     additionalProperties=false => do not add extra keys.
     """
-    schema_path = Path("schemas") / "run_manifest-1.0.schema.json"
-    if not schema_path.exists():
-        fail(f"missing schema: {schema_path}")
-
-    # Phase 1 canonical output names
-    timeline_json = FB_OUT / "sean_timeline.json"
-    topics_csv = FB_OUT / "sean_topics.csv"
-    enriched_jsonl = FB_OUT / "sean_context_enriched.v2.jsonl"
-    signals_dir = FB_OUT / "signals"
-    docs_dir = Path("docs")
-    stats_path = FB_OUT / "sean_stats.json"
-
-    required_paths = [posts_src, comments_src, timeline_json, topics_csv, enriched_jsonl, signals_dir, docs_dir, stats_path]
+    if not RUN_MANIFEST_SCHEMA.exists():
+        fail(f"missing schema: {RUN_MANIFEST_SCHEMA}")
+
+    # Most required paths live directly in FB_OUT: one directory listing
+    # answers their presence instead of a stat() each. Only the inputs are
+    # stat'ed, since their (mtime, size) keys the hash cache.
+    with os.scandir(FB_OUT) as it:
+        present = {e.name for e in it}
+
+    required_paths = [posts_src, comments_src, TIMELINE_JSON, TOPICS_CSV, ENRICHED_JSONL, SIGNALS_DIR, DOCS_DIR, STATS_JSON]
+    st_by_path = {}
     for p in required_paths:
-        if not p.exists():
+        if p in (posts_src, comments_src):
+            st_by_path[p] = st = _stat_or_none(p)
+            found = st is not None
+        elif p.parent == FB_OUT:
+            found = p.name in present
+        else:
+            found = p.exists()
+        if not found:
             raise RuntimeError(f"run_manifest: missing required path: {p}")
 
-    stats = json.loads(stats_path.read_text(encoding="utf-8"))
+    stats = json.loads(STATS_JSON.read_text(encoding="utf-8"))
     counts = {
         "posts": int(stats.get("input_posts", 0)),
         "comments": int(stats.get("input_comments", 0)),
         "timeline_rows": int(stats.get("kept_nonempty", 0)),
     }
 
-    def norm(p: Path) -> str:
-        return str(p).replace("\\", "/")
-
     manifest = {
         "run_id": run_id,
         "subject_label": subject_label,
         "generated_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
         "inputs": {
-            "posts_path": norm(posts_src),
-            "comments_path": norm(comments_src),
-            "posts_sha256": _sha256_file(posts_src),
-            "comments_sha256": _sha256_file(comments_src),
+            "posts_path": posts_src.as_posix(),
+            "comments_path": comments_src.as_posix(),
+            "posts_sha256": _sha256_file(posts_src, st_by_path[posts_src]),
+            "comments_sha256": _sha256_file(comments_src, st_by_path[comments_src]),
         },
         "counts": counts,
         "fingerprints": {},
         "artifacts": {
-            "run_dir": norm(run_dir),
-            "timeline_json": norm(timeline_json),
-            "topics_csv": norm(topics_csv),
-            "context_enriched_jsonl": norm(enriched_jsonl),
-            "signals_dir": norm(signals_dir),
-            "docs_dir_snapshot": norm(docs_dir),
+            "run_dir": run_dir.as_posix(),
+            "timeline_json": TIMELINE_JSON.as_posix(),
+            "topics_csv": TOPICS_CSV.as_posix(),
+            "context_enriched_jsonl": ENRICHED_JSONL.as_posix(),
+            "signals_dir": SIGNALS_DIR.as_posix(),
+            "docs_dir_snapshot": DOCS_DIR.as_posix(),
         },
     }
 
-    out_path = FB_OUT / "run_manifest.json"
-    _write_json(out_path, manifest)
-    print(f"[OK] wrote run_manifest: {out_path}")
-    return out_path
+    _write_json(RUN_MANIFEST_PATH, manifest)
+    print(f"[OK] wrote run_manifest: {RUN_MANIFEST_PATH}")
+    return RUN_MANIFEST_PATH
 
 
 def main() -> None:
@@ -152,8 +393,12 @@ def main() -> None:
 
     posts_abs = posts_src.resolve()
     comments_abs = comments_src.resolve()
-    canon_posts_abs = CANON_POSTS.resolve() if CANON_POSTS.exists() else None
-    canon_comments_abs = CANON_COMMENTS.resolve() if CANON_COMMENTS.exists() else None
+    # Canonical files are not touched until the remap below, so one stat each
+    # answers both "is the input already canonical" and "will we create it".
+    canon_posts_existed = _stat_or_none(CANON_POSTS) is not None
+    canon_comments_existed = _stat_or_none(CANON_COMMENTS) is not None
+    canon_posts_abs = CANON_POSTS.resolve() if canon_posts_existed else None
+    canon_comments_abs = CANON_COMMENTS.resolve() if canon_comments_existed else None
 
     posts_is_canon = (canon_posts_abs is not None and posts_abs == canon_posts_abs)
     comments_is_canon = (canon_comments_abs is not None and comments_abs == canon_comments_abs)
@@ -173,64 +418,65 @@ def main() -> None:
     try:
         # Map to canonical files if needed
         if not posts_is_canon:
-            if not CANON_POSTS.exists():
-                created_posts = True
-            shutil.copy2(posts_src, CANON_POSTS)
+            created_posts = not canon_posts_existed
+            link_or_copy(posts_src, CANON_POSTS)
             print(f"[OK] mapped posts -> {CANON_POSTS}")
         else:
             print(f"[OK] posts already canonical: {CANON_POSTS}")
 
         if not comments_is_canon:
-            if not CANON_COMMENTS.exists():
-                created_comments = True
-            shutil.copy2(comments_src, CANON_COMMENTS)
+            created_comments = not canon_comments_existed
+            link_or_copy(comments_src, CANON_COMMENTS)
             print(f"[OK] mapped comments -> {CANON_COMMENTS}")
         else:
             print(f"[OK] comments already canonical: {CANON_COMMENTS}")
 
         # Legacy aliases for existing pipeline steps
         if not LEGACY_POSTS.exists():
-            shutil.copy2(CANON_POSTS, LEGACY_POSTS)
+            link_or_copy(CANON_POSTS, LEGACY_POSTS)
             legacy_posts_created = True
             print(f"[OK] created legacy alias: {LEGACY_POSTS} -> {CANON_POSTS}")
 
         if not LEGACY_COMMENTS.exists():
-            shutil.copy2(CANON_COMMENTS, LEGACY_COMMENTS)
+            link_or_copy(CANON_COMMENTS, LEGACY_COMMENTS)
             legacy_comments_created = True
             print(f"[OK] created legacy alias: {LEGACY_COMMENTS} -> {CANON_COMMENTS}")
 
-        # Pipeline steps
-        run([sys.executable, "pipeline/step2_build_timeline.py"])
-        run([sys.executable, "pipeline/step3_analyze_reason.py"])
-        run([sys.executable, "tools/context_enrich.py"])
-        run([sys.executable, "tools/data_quality_metrics.py"])
-        run([sys.executable, "tools/behavioral_metrics_v0_3.py"])
+        # Pipeline steps (in-process; contracts stay in a subprocess below)
+        run_script("pipeline/step2_build_timeline.py")
+        run_script("pipeline/step3_analyze_reason.py")
+        run_script("tools/context_enrich.py")
+        # Both only read the enriched JSONL and write separate docs/data outputs.
+        run_parallel([
+            [sys.executable, "tools/data_quality_metrics.py"],
+            [sys.executable, "tools/behavioral_metrics_v0_3.py"],
+        ])
 
         # Signals: run all specs deterministically
         specs_dir = Path("signals")
         if not specs_dir.exists():
             fail("missing signals/ directory")
 
-        signal_input = FB_OUT / "sean_context_enriched.v2.jsonl"
+        signal_input = ENRICHED_JSONL
         if not signal_input.exists():
             fail(f"missing expected signal input: {signal_input}")
 
-        out_dir = FB_OUT / "signals"
+        out_dir = SIGNALS_DIR
         out_dir.mkdir(parents=True, exist_ok=True)
 
         specs = sorted(specs_dir.glob("*.json"))
         if not specs:
             fail("no signal specs found in signals/*.json")
 
-        for spec in specs:
-            run([sys.executable, "tools/run_signal.py", str(spec), str(signal_input), str(out_dir)])
+        # Specs are independent (one <signal_id>.json each); logs follow sorted spec order.
+        run_signals(specs, signal_input, out_dir)
 
-        run([sys.executable, "tools/build_signals_index.py"])
-        run([sys.executable, "tools/generate_signals_page.py"])
-        run([sys.executable, "tools/generate_topic_category_pages.py"])
-        run([sys.executable, "tools/generate_conclusion_page.py"])
-        run([sys.executable, "tools/patch_global_nav.py"])
-        run([sys.executable, "tools/patch_topic_nav.py"])
+        run_script("tools/build_signals_index.py")
+        run_script("tools/generate_signals_page.py")
+        run_script("tools/generate_topic_category_pages.py")
+        run_script("tools/generate_conclusion_page.py")
+        run_script("tools/patch_global_nav.py")
+        run_script("tools/patch_topic_nav.py")
 
         # Emit schema-locked run manifest BEFORE contracts/cleanup
         _emit_run_manifest(
@@ -246,12 +492,11 @@ def main() -> None:
 
         # Snapshot artifacts into run_dir (published_docs + artifacts)
         (run_dir / "artifacts").mkdir(parents=True, exist_ok=True)
-        shutil.copy2(FB_OUT / "sean_timeline.json", run_dir / "artifacts" / "sean_timeline.json")
-        shutil.copy2(FB_OUT / "sean_topics.csv", run_dir / "artifacts" / "sean_topics.csv")
-        shutil.copy2(FB_OUT / "sean_context_enriched.v2.jsonl", run_dir / "artifacts" / "sean_context_enriched.v2.jsonl")
+        for artifact in (TIMELINE_JSON, TOPICS_CSV, ENRICHED_JSONL):
+            copy_file(artifact, run_dir / "artifacts" / artifact.name)
 
-        copy_tree(FB_OUT / "signals", run_dir / "artifacts" / "signals")
-        copy_tree(Path("docs"), run_dir / "published_docs" / "docs")
+        copy_tree(SIGNALS_DIR, run_dir / "artifacts" / "signals")
+        copy_tree(DOCS_DIR, run_dir / "published_docs" / "docs")
 
         print(f"[OK] run complete: {args.run_id}")
 
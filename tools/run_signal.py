@@ -1,32 +1,80 @@
 import json
 import hashlib
+import operator
 import re
 import sys
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used as a drop-in fallback
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional; contains_any falls back to one `in` scan per needle
+    ahocorasick = None
 
 
 # -----------------------------
 # Utilities
 # -----------------------------
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 def load_json(path: Path) -> dict:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _loads(path.read_bytes())
 
 def load_jsonl(path: Path) -> List[dict]:
     items: List[dict] = []
-    with path.open("r", encoding="utf-8") as f:
+    with path.open("rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            # Both loaders accept surrounding whitespace, so only blank lines
+            # need skipping; isspace() avoids a strip() copy per record.
+            if line.isspace():
                 continue
-            items.append(json.loads(line))
+            items.append(_loads(line))
     return items
 
+def _orjson_matches_stdlib(obj: Any) -> bool:
+    """
+    True if orjson renders every float in obj exactly as the stdlib does.
+    They differ on exponent notation (stdlib 1e-07 / 1e+16, orjson 1e-7 /
+    1e16) and on non-finite values (stdlib NaN, orjson null).
+    """
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, float):
+            a = abs(x)
+            if a != a or a == float("inf") or (a and not 1e-4 <= a < 1e16):
+                return False
+        elif isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, (list, tuple)):
+            stack.extend(x)
+    return True
+
+def dump_json(path: Path, obj: Any) -> None:
+    # orjson only when its bytes would equal json.dump's, so signal output
+    # never depends on what is installed; values it rejects (ints beyond 64
+    # bits, non-str keys) fall back too.
+    if orjson is not None and _orjson_matches_stdlib(obj):
+        try:
+            path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+            return
+        except orjson.JSONEncodeError:
+            pass
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
 def fp_obj(obj: Any) -> str:
+    # Stays on stdlib json on purpose: fingerprints are published and compared
+    # across runs, and orjson's compact separators would change every hash.
     blob = json.dumps(obj, sort_keys=True, ensure_ascii=False).encode("utf-8")
     return hashlib.sha256(blob).hexdigest()[:16]
 
@@ -39,6 +87,15 @@ def month_key(ts: str) -> str:
     We keep this tolerant: parse only the prefix if needed.
     """
     # Common: "2026-02-06T18:30:12+00:00" or "2026-02-06T18:30:12Z"
+    # Fast path for "YYYY-MM-...": the prefix is the answer either way
+    # (fromisoformat would reformat the same digits, and an unparseable
+    # date such as month 13 hits the prefix fallback below).
+    head = ts[:8]
+    if (
+        len(head) == 8 and head.isascii() and head[4] == "-" and head[7] == "-"
+        and head[:4].isdigit() and head[5:7].isdigit()
+    ):
+        return head[:7]
     try:
         # Normalize Z
         if ts.endswith("Z"):
@@ -75,9 +132,10 @@ class Condition:
     op: str
     value: Any
 
-def get_field(item: dict, field: str) -> Any:
-    # support shallow fields only (by design for v1)
-    return item.get(field)
+def field_getter(field: str) -> Callable[[dict], Any]:
+    # support shallow fields only (by design for v1); bound once per
+    # condition so the per-item fetch is a single C call (item.get(field)).
+    return operator.methodcaller("get", field)
 
 def op_equals(v: Any, target: Any) -> bool:
     return v == target
@@ -99,31 +157,84 @@ def op_lte(v: Any, target: Any) -> bool:
     except Exception:
         return False
 
-def op_regex_any(v: Any, patterns: Any) -> bool:
-    if not isinstance(v, str):
-        return False
+def compile_patterns(patterns: Any) -> Tuple["re.Pattern[str]", ...]:
+    """
+    Compile a regex_any value once per spec load (case-insensitive).
+    Patterns are tried in order and an invalid one fails the whole condition
+    closed, so only the valid prefix before the first invalid pattern can
+    ever match; anything after it is dropped here.
+    """
     if isinstance(patterns, str):
         patterns = [patterns]
     if not isinstance(patterns, list):
-        return False
+        return ()
+    compiled = []
     for p in patterns:
         try:
-            if re.search(p, v, flags=re.IGNORECASE):
-                return True
+            compiled.append(re.compile(p, re.IGNORECASE))
         except re.error:
             # invalid regex pattern -> fail closed
-            return False
-    return False
+            break
+    return _combine_patterns(compiled)
 
-def op_contains_any(v: Any, needles: Any) -> bool:
+# Group references are numbered/named per pattern; they would point at the
+# wrong group once patterns are joined into one alternation.
+_GROUP_REF_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+def _combine_patterns(compiled: List["re.Pattern[str]"]) -> Tuple["re.Pattern[str]", ...]:
+    """
+    Join the patterns into one `(?:p1)|(?:p2)|...` so each item is scanned
+    once instead of once per pattern; a match of the union is a match of
+    some pattern. Falls back to the per-pattern list when the union does
+    not compile (e.g. inline global flags) or patterns use group references.
+    """
+    if len(compiled) < 2 or any(_GROUP_REF_RE.search(p.pattern) for p in compiled):
+        return tuple(compiled)
+    try:
+        return (re.compile("|".join(f"(?:{p.pattern})" for p in compiled), re.IGNORECASE),)
+    except re.error:
+        return tuple(compiled)
+
+def op_regex_any(v: Any, compiled: Tuple["re.Pattern[str]", ...]) -> bool:
     if not isinstance(v, str):
         return False
+    for pat in compiled:
+        if pat.search(v):
+            return True
+    return False
+
+# Below this many needles, building an automaton does not pay off.
+AHO_MIN_NEEDLES = 5
+
+def compile_needles(needles: Any) -> Any:
+    """
+    Lowercase a contains_any value once per spec load. Large needle lists
+    become an Aho-Corasick automaton (when pyahocorasick is installed) so an
+    item is scanned in one pass; otherwise a tuple of lowered needles.
+    """
     if isinstance(needles, str):
         needles = [needles]
     if not isinstance(needles, list):
+        return ()
+    lowered = tuple(str(n).lower() for n in needles)
+    # An empty needle matches every string; the automaton would never report it.
+    if ahocorasick is None or len(lowered) < AHO_MIN_NEEDLES or "" in lowered:
+        return lowered
+    automaton = ahocorasick.Automaton()
+    for n in lowered:
+        automaton.add_word(n, n)
+    automaton.make_automaton()
+    return automaton
+
+def op_contains_any(v: Any, needles: Any) -> bool:
+    if not isinstance(v, str):
         return False
-    low = v.lower()
-    return any(str(n).lower() in low for n in needles)
+    return contains_lowered(v.lower(), needles)
+
+def contains_lowered(low: str, needles: Any) -> bool:
+    if isinstance(needles, tuple):
+        return any(n in low for n in needles)
+    return next(needles.iter(low), None) is not None
 
 OPS = {
     "equals": op_equals,
@@ -134,27 +245,64 @@ OPS = {
     "contains_any": op_contains_any,
 }
 
-def eval_condition(item: dict, cond: dict) -> bool:
-    field = cond["field"]
-    op = cond["op"]
-    value = cond["value"]
-    fn = OPS.get(op)
-    if fn is None:
-        raise SystemExit(f"Unsupported op: {op}")
-    v = get_field(item, field)
-    return fn(v, value)
-
-def eval_rule(item: dict, rule: dict) -> Tuple[bool, List[str]]:
+def eval_condition(item: dict, cond: dict, lowered: Optional[Dict[str, str]] = None) -> bool:
+    """
+    `cond` is a condition from prepare_rule (getter and op already bound).
+    `lowered` is an optional per-item memo of field -> v.lower(), so several
+    contains_any conditions on the same field lowercase it only once.
+    """
+    v = cond["_get"](item)
+    if lowered is not None and cond["_lower"] and isinstance(v, str):
+        field = cond["field"]
+        low = lowered.get(field)
+        if low is None:
+            low = lowered[field] = v.lower()
+        return contains_lowered(low, cond["value"])
+    return cond["_fn"](v, cond["value"])
+
+# Relative per-item cost of each op; cheap, usually selective comparisons
+# run first so short-circuiting skips the string scans.
+OP_COST = {
+    "equals": 0,
+    "in": 0,
+    "gte": 0,
+    "lte": 0,
+    "contains_any": 1,
+    "regex_any": 2,
+}
+
+def prepare_rule(rule: dict) -> dict:
+    """
+    Copy of `rule` ready for evaluation: field getter and op function bound
+    per condition, regex_any/contains_any values compiled, and conditions
+    ordered by OP_COST (order does not change an all/any result).
+    The spec itself is left untouched so its fingerprint is unchanged.
+    """
+    conds = []
+    for c in rule["conditions"]:
+        if c["op"] not in OPS:
+            # Checked up front: short-circuiting may never reach this condition.
+            raise SystemExit(f"Unsupported op: {c['op']}")
+        op = c["op"]
+        c = {**c, "_get": field_getter(c["field"]), "_fn": OPS[op], "_lower": op == "contains_any"}
+        if op == "regex_any":
+            c["value"] = compile_patterns(c["value"])
+        elif op == "contains_any":
+            c["value"] = compile_needles(c["value"])
+        conds.append(c)
+    conds.sort(key=lambda c: OP_COST[c["op"]])
+    return {**rule, "conditions": conds}
+
+def eval_rule(item: dict, rule: dict, lowered: Optional[Dict[str, str]] = None) -> Tuple[bool, List[str]]:
     """
     Returns (hit, [rule_id]) so we can accumulate hits.
     """
     logic = rule["logic"]
     conds = rule["conditions"]
-    results = [eval_condition(item, c) for c in conds]
     if logic == "all":
-        hit = all(results)
+        hit = all(eval_condition(item, c, lowered) for c in conds)
     elif logic == "any":
-        hit = any(results)
+        hit = any(eval_condition(item, c, lowered) for c in conds)
     else:
         raise SystemExit(f"Unsupported rule.logic: {logic}")
     return hit, [rule["rule_id"]] if hit else []
@@ -184,6 +332,33 @@ def score_item(signal: dict, item: dict, rule_hits: List[str]) -> int:
 # Main runner
 # -----------------------------
 
+@dataclass(slots=True)
+class Hit:
+    """
+    Per-hit record kept while scanning: just what sorting needs plus an
+    index back into `items`. The full example dict is only built for the
+    hits that survive example selection.
+    """
+    item_ref: int
+    source_index: Any
+    ts: str
+    score: int
+    rule_hits: List[str]
+
+def example_dict(item: dict, hit: Hit) -> dict:
+    return {
+        "source_index": item.get("source_index"),
+        "timestamp_parsed": item.get("timestamp_parsed"),
+        "captured_at": item.get("captured_at"),
+        "joined_item_type": item.get("joined_item_type"),
+        "body": item.get("body", ""),
+        "thread_permalink": item.get("thread_permalink"),
+        "thread_primary_topic": item.get("thread_primary_topic", ""),
+        "sentiment_compound": item.get("sentiment_compound", 0),
+        "rule_hits": sorted(set(hit.rule_hits)),
+        "score": hit.score,
+    }
+
 def validate_required_fields(signal: dict, item: dict) -> None:
     required = signal["definition"]["required_input_fields"]
     missing = [f for f in required if f not in item]
@@ -197,16 +372,17 @@ def run_signal(signal: dict, items: List[dict]) -> dict:
         raise SystemExit("Input JSONL is empty.")
     validate_required_fields(signal, items[0])
 
-    inclusions = signal["definition"]["inclusion_rules"]
-    exclusions = signal["definition"]["exclusion_rules"]
+    inclusions = [prepare_rule(r) for r in signal["definition"]["inclusion_rules"]]
+    exclusions = [prepare_rule(r) for r in signal["definition"]["exclusion_rules"]]
 
-    hits: List[dict] = []
+    hits: List[Hit] = []
 
-    for it in items:
+    for idx, it in enumerate(items):
+        lowered: Dict[str, str] = {}
         # Inclusion must hit at least one inclusion rule (we allow multiple)
         inc_hits: List[str] = []
         for rule in inclusions:
-            ok, rh = eval_rule(it, rule)
+            ok, rh = eval_rule(it, rule, lowered)
             if ok:
                 inc_hits.extend(rh)
 
@@ -217,7 +393,7 @@ def run_signal(signal: dict, items: List[dict]) -> dict:
         excluded = False
         ex_hits: List[str] = []
         for rule in exclusions:
-            ok, rh = eval_rule(it, rule)
+            ok, rh = eval_rule(it, rule, lowered)
             if ok:
                 excluded = True
                 ex_hits.extend(rh)
@@ -226,49 +402,40 @@ def run_signal(signal: dict, items: List[dict]) -> dict:
 
         score = score_item(signal, it, inc_hits)
 
-        hits.append({
-            "source_index": it.get("source_index"),
-            "timestamp_parsed": it.get("timestamp_parsed"),
-            "captured_at": it.get("captured_at"),
-            "joined_item_type": it.get("joined_item_type"),
-            "body": it.get("body", ""),
-            "thread_permalink": it.get("thread_permalink"),
-            "thread_primary_topic": it.get("thread_primary_topic", ""),
-            "sentiment_compound": it.get("sentiment_compound", 0),
-            "rule_hits": sorted(set(inc_hits)),
-            "score": score,
-        })
+        hits.append(Hit(
+            item_ref=idx,
+            source_index=it.get("source_index"),
+            ts=str(it.get("timestamp_parsed") or ""),
+            score=score,
+            rule_hits=inc_hits,
+        ))
 
     # Metrics
     count = len(hits)
     total = len(items)
     rate_per_100 = (count / total * 100.0) if total else 0.0
 
-    dist: Dict[str, int] = {}
-    for h in hits:
-        mk = month_key(get_time_for_binning(h))
-        dist[mk] = dist.get(mk, 0) + 1
+    dist = Counter(month_key(get_time_for_binning(items[h.item_ref])) for h in hits)
     # Deterministic ordering
-    dist_sorted = dict(sorted(dist.items(), key=lambda kv: kv[0]))
+    dist_sorted = dict(sorted(dist.items()))
 
     # Example selection
     sel = signal["outputs"]["example_selection"]
     max_examples = int(sel["max_examples"])
     ordering = sel["ordering"]
 
-    def sort_key(h: dict):
-        ts = str(h.get("timestamp_parsed") or "")
+    def sort_key(h: Hit):
         if ordering == "time_desc":
-            return (ts, h.get("source_index", 0))
+            return (h.ts, h.source_index)
         if ordering == "score_desc_then_time":
-            return (h.get("score", 0), ts, h.get("source_index", 0))
+            return (h.score, h.ts, h.source_index)
         # "source_index_asc"
-        return (h.get("source_index", 0), ts)
+        return (h.source_index, h.ts)
 
     reverse = ordering in ("time_desc", "score_desc_then_time")
     hits_sorted = sorted(hits, key=sort_key, reverse=reverse)
 
-    examples = hits_sorted[:max_examples]
+    examples = [example_dict(items[h.item_ref], h) for h in hits_sorted[:max_examples]]
 
     # Dataset scope
     times = [get_time_for_binning(it) for it in items]
@@ -313,24 +480,29 @@ def run_signal(signal: dict, items: List[dict]) -> dict:
     }
     return out
 
-def main(signal_path: Path, input_jsonl: Path, out_dir: Path):
+def write_signal(signal_path: Path, items: List[dict], out_dir: Path) -> Path:
+    """
+    Run one spec against already-loaded items and write <signal_id>.json.
+    Shared by main() and run_pipeline's in-process fan-out.
+    """
     signal = load_json(signal_path)
-    items = load_jsonl(input_jsonl)
-
     out = run_signal(signal, items)
 
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"{signal['signal_id']}.json"
-    with out_path.open("w", encoding="utf-8") as f:
-        json.dump(out, f, indent=2, ensure_ascii=False)
+    dump_json(out_path, out)
+    return out_path
 
-    print(f"Wrote: {out_path}")
+def main(signal_paths: List[Path], input_jsonl: Path, out_dir: Path):
+    # Parse the input once and evaluate every spec against it.
+    items = load_jsonl(input_jsonl)
+    for signal_path in signal_paths:
+        out_path = write_signal(signal_path, items, out_dir)
+        print(f"Wrote: {out_path}")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 4:
-        print("Usage: python tools/run_signal.py <signal.json> <input.jsonl> <out_dir>")
+    if len(sys.argv) < 4:
+        print("Usage: python tools/run_signal.py <signal.json> [<signal.json> ...] <input.jsonl> <out_dir>")
         raise SystemExit(2)
 
-    main(Path(sys.argv[1]), Path(sys.argv[2]), Path(sys.argv[3]))
-
-
+    main([Path(a) for a in sys.argv[1:-2]], Path(sys.argv[-2]), Path(sys.argv[-1]))
@@ -1,5 +1,12 @@
+import argparse
+import contextlib
+import functools
 import json
+import os
+import queue
 import re
+import tempfile
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -7,12 +14,18 @@ from urllib.parse import quote_plus, urljoin, urlparse, urlunparse
 
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used as a drop-in fallback
+    orjson = None
+
 # ============================================================
 # CONFIG
 # ============================================================
 GROUP_ID = "3970539883001618"
 TARGET_AUTHOR = "Sean Roy"
 SEARCH_QUERY = "sean roy"
+_TARGET_AUTHOR_CF = TARGET_AUTHOR.casefold() if TARGET_AUTHOR else ""
 
 GROUP_SEARCH_URL = f"https://www.facebook.com/groups/{GROUP_ID}/search/?q={quote_plus(SEARCH_QUERY)}"
 
@@ -20,15 +33,21 @@ OUTPUT_DIR = Path("fb_extract_out")
 HEADLESS = False
 
 # Harvest behavior (Phase 1)
-SCROLL_PAUSE_SEC = 1.4               # give FB time to hydrate
+SCROLL_PAUSE_SEC = 1.4               # max wait for new articles after each scroll
+PAGE_READY_TIMEOUT_MS = 8_000        # max wait for search/member page content after goto
 HARVEST_MAX_MINUTES = 25             # hard runtime cap for harvesting
 HARVEST_NO_NEW_MINUTES = 6           # stop only after this many minutes with no new links
 HARVEST_MAX_NEW_LINKS_PER_RUN = 5000 # safety cap
 
 # Scrape behavior (Phase 2)
 POST_NAV_TIMEOUT_MS = 60_000
-POST_PAGE_WAIT_SEC = 0.8
+POST_READY_SELECTOR = "abbr, #m_story_permalink_view, div[role='main']"
+POST_READY_TIMEOUT_MS = 3_000        # max wait for the mbasic post root after goto
 MAX_POST_PAGES_TO_SCRAPE = 10_000
+OUTPUT_FLUSH_EVERY = 100             # flush Phase 2 JSONL outputs every N written posts
+SCRAPE_WORKERS = 1                   # parallel browser contexts for Phase 2 (--workers)
+# mbasic is read for text only: Phase 2 contexts abort these request types
+PHASE2_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
 
 # Debug
 DEBUG_FIRST_N = 12
@@ -40,29 +59,78 @@ ASSUME_AUTHOR_FROM_MEMBER_PAGE = True
 # ============================================================
 # Helpers
 # ============================================================
+_ALPHA_START_RE = re.compile(r"^[A-Za-z]")
+_TWO_NAME_RE = re.compile(r"^[A-Z][a-z]+ [A-Z][a-z]+")
+_FB_TAIL_RE = re.compile(r"facebook\.com/[^/?]+/?$")
+_PERMALINK_RE = re.compile(rb'"permalink"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
 def now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
 def norm_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip())
+    # str.split() with no separator splits on the same Unicode whitespace as
+    # \s and drops leading/trailing runs, without a regex pass.
+    return " ".join((s or "").split())
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def jsonl_line(obj: dict) -> bytes:
+    # UTF-8 encoded JSONL record (non-ASCII kept as-is), newline included.
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class JsonlWriter:
+    """
+    Append-only JSONL file kept open (1 MiB buffer) for a whole phase instead
+    of an open/write/close per record. Flushing is left to the caller so that
+    related files can be flushed together, in a chosen order.
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = path.open("ab", buffering=1 << 20)
 
+    def write(self, obj: dict) -> None:
+        self._fh.write(jsonl_line(obj))
 
-def append_jsonl(path: Path, obj: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    def write_line(self, line: bytes) -> None:
+        # Pre-encoded jsonl_line() output, for records shared across files.
+        self._fh.write(line)
+
+    def flush(self) -> None:
+        self._fh.flush()
+
+    def close(self) -> None:
+        self._fh.close()
+
+    def __enter__(self) -> "JsonlWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def iter_jsonl_lines(path: Path):
+    # Streams non-blank raw lines; callers decode with _loads (bytes in).
+    with path.open("rb") as f:
+        for line in f:
+            if not line.isspace():
+                yield line
 
 
 def load_jsonl_keys(path: Path, key: str) -> set[str]:
     out = set()
     if not path.exists():
         return out
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        if not line.strip():
-            continue
+    for line in iter_jsonl_lines(path):
         try:
-            o = json.loads(line)
+            o = _loads(line)
             v = o.get(key)
             if v:
                 out.add(v)
@@ -71,15 +139,25 @@ def load_jsonl_keys(path: Path, key: str) -> set[str]:
     return out
 
 
+def load_permalinks(path: Path) -> set[str]:
+    # Success markers only need one field: pull it out of the raw bytes
+    # instead of decoding every record. Escaped values (rare) go through _loads.
+    if not path.exists():
+        return set()
+    out = set()
+    for m in _PERMALINK_RE.findall(path.read_bytes()):
+        if m:
+            out.add(_loads(b'"' + m + b'"') if b"\\" in m else m.decode("utf-8"))
+    return out
+
+
 def load_jsonl_map(path: Path, key: str) -> dict[str, dict]:
     out: dict[str, dict] = {}
     if not path.exists():
         return out
-    for line in path.read_text(encoding="utf-8", errors="ignore").splitlines():
-        if not line.strip():
-            continue
+    for line in iter_jsonl_lines(path):
         try:
-            o = json.loads(line)
+            o = _loads(line)
             k = o.get(key)
             if k:
                 out[k] = o
@@ -88,28 +166,39 @@ def load_jsonl_map(path: Path, key: str) -> dict[str, dict]:
     return out
 
 
-def click_see_more(page):
+def wait_for_selector_best_effort(page, selector: str, timeout_ms: int) -> None:
+    # Returns as soon as the selector is attached; on timeout, carry on with
+    # whatever the page has (the old fixed sleeps never failed either).
+    try:
+        page.wait_for_selector(selector, state="attached", timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        pass
+
+
+def click_see_more(page, max_clicks: int = 40):
+    # textContent rather than innerText: no forced layout per button.
     page.evaluate(
         """
-        () => {
+        (maxClicks) => {
           const needles = new Set(["See more","See More","Show more","Show More","More"]);
-          const btns = Array.from(document.querySelectorAll('div[role="button"], span[role="button"], a[role="button"]'));
+          const btns = document.querySelectorAll('div[role="button"], span[role="button"], a[role="button"]');
           let n = 0;
           for (const b of btns) {
-            const t = (b.innerText || "").trim();
+            const t = (b.textContent || "").trim();
             if (!t) continue;
             if (!needles.has(t)) continue;
             try { b.click(); n++; } catch {}
-            if (n >= 40) break;
+            if (n >= maxClicks) break;
           }
           return n;
         }
-        """
+        """,
+        max_clicks,
     )
 
 
 def scroll_best_effort(page):
-    page.evaluate(
+    return page.evaluate(
         """
         () => {
           function findScrollable() {
@@ -129,18 +218,24 @@ def scroll_best_effort(page):
             return best;
           }
           const sc = findScrollable();
+          const doc_sh = document.scrollingElement.scrollHeight;
           if (sc) {
             sc.scrollTop = sc.scrollHeight;
-            return { mode:"container", sh: sc.scrollHeight, ch: sc.clientHeight };
+            return { mode:"container", sh: sc.scrollHeight, ch: sc.clientHeight, doc_sh };
           }
           window.scrollTo(0, document.body.scrollHeight);
-          return { mode:"window", sh: document.body.scrollHeight };
+          return { mode:"window", sh: document.body.scrollHeight, doc_sh };
         }
         """
     )
 
 
+@functools.lru_cache(maxsize=20_000)
 def make_mbasic_url(url: str) -> str:
+    # A facebook.com host implies the substring somewhere in the URL, so
+    # anything else is returned without parsing.
+    if "facebook.com" not in url.lower():
+        return url
     p = urlparse(url)
     host = p.netloc.lower()
     if "facebook.com" not in host:
@@ -174,57 +269,104 @@ def dump_failure_artifacts(page, idx: int):
         print(f"[!] html dump failed: {e}")
 
 
+_STOP_MARKERS = frozenset({
+    "Write a comment", "Write a Comment",
+    "View more comments", "View previous comments",
+    "More Comments", "Add a comment", "Add a Comment",
+})
+_JUNK_EXACT = frozenset({
+    "Like", "Comment", "Share", "More", "Full Story",
+    "See translation", "See Translation",
+    "React", "Reply", "Send", "Copy link", "Copy Link",
+    "Privacy · Terms · Advertising · Ad Choices · Cookies · Meta ©",
+})
+_NAV_WORDS = frozenset({"home", "groups", "watch", "marketplace"})
+
+
 def clean_mbasic_text(raw: str) -> str:
     """
     mbasic returns a lot of UI glue. We aggressively filter common junk lines.
     """
-    raw = (raw or "").strip()
     if not raw:
         return ""
 
-    lines = [l.strip() for l in raw.splitlines()]
+    # Single pass: kept lines are non-empty and stripped, so the joined text
+    # has no blank runs or outer whitespace left to collapse afterwards.
     out = []
-    stop_markers = {
-        "Write a comment", "Write a Comment",
-        "View more comments", "View previous comments",
-        "More Comments", "Add a comment", "Add a Comment",
-    }
-    junk_exact = {
-        "Like", "Comment", "Share", "More", "Full Story",
-        "See translation", "See Translation",
-        "React", "Reply", "Send", "Copy link", "Copy Link",
-        "Privacy · Terms · Advertising · Ad Choices · Cookies · Meta ©",
-    }
-
-    for l in lines:
+    for l in raw.splitlines():
+        l = l.strip()
         if not l:
             continue
-        if l in stop_markers:
+        if l in _STOP_MARKERS:
             break
-        if l in junk_exact:
+        if l in _JUNK_EXACT:
             continue
         # junk-ish short lines
-        low = l.casefold()
         if len(l) <= 3:
             continue
-        if low in {"home", "groups", "watch", "marketplace"}:
+        low = l.casefold()
+        if low in _NAV_WORDS:
             continue
         if low.startswith("people who reacted"):
             continue
         out.append(l)
 
-    text = "\n".join(out).strip()
-    # final collapse of excessive blank space
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    return text
+    return "\n".join(out)
 
 
 # ============================================================
 # Phase 1: Resolve Sean member page URL from group search
 # ============================================================
+# JS sources are constants taking the group id as an argument, so Playwright
+# ships/parses the same function every call instead of a freshly formatted blob.
+SEARCH_MEMBER_JS = r"""
+(gid) => {
+  const needle = '/groups/' + gid + '/user/';
+  const groupUser = [];
+  for (const a of document.querySelectorAll('a[href]')) {
+    const href = a.getAttribute('href') || "";
+    if (href.includes(needle)) {
+      groupUser.push(href);
+    }
+  }
+  let best = null;
+  let bestLen = 1e9;
+  for (const h of groupUser) {
+    const base = h.split('?',1)[0];
+    if (base.length < bestLen) { bestLen = base.length; best = base; }
+  }
+  return { groupUserCount: groupUser.length, bestGroupUserHref: best };
+}
+"""
+
+# Only hrefs not returned in an earlier round come back: the JS-side
+# window.__seenPostHrefs persists across rounds on this page, so late rounds
+# on a long feed do not re-ship every anchor. The Python-side `seen` in
+# harvest_post_links_from_member stays the authoritative (cross-run) dedupe.
+HARVEST_LINKS_JS = r"""
+(gid) => {
+  const seen = window.__seenPostHrefs || (window.__seenPostHrefs = new Set());
+  const needle = '/groups/' + gid + '/';
+  const out = [];
+  for (const a of document.querySelectorAll('a[href]')) {
+    const h = a.getAttribute('href');
+    if (!h || h.indexOf(needle) < 0) continue;
+    const q = h.indexOf('?');
+    const base = q < 0 ? h : h.slice(0, q);
+    if (seen.has(base)) continue;
+    if (!base.includes(needle + 'posts/') && !base.includes(needle + 'permalink/')) continue;
+    seen.add(base);
+    out.push(base);
+  }
+  // Article count (progress log only) rides along instead of a second round trip.
+  return { hrefs: out, articles: document.querySelectorAll('[role="article"]').length };
+}
+"""
+
+
 def resolve_member_url_from_search(page) -> str | None:
     page.goto(GROUP_SEARCH_URL, wait_until="domcontentloaded", timeout=POST_NAV_TIMEOUT_MS)
-    time.sleep(3.0)
+    wait_for_selector_best_effort(page, f"a[href*='/groups/{GROUP_ID}/user/']", PAGE_READY_TIMEOUT_MS)
 
     print(f"[*] search url={page.url}")
     try:
@@ -232,27 +374,7 @@ def resolve_member_url_from_search(page) -> str | None:
     except Exception:
         pass
 
-    data = page.evaluate(
-        f"""
-        () => {{
-          const anchors = Array.from(document.querySelectorAll('a[href]'));
-          const groupUser = [];
-          for (const a of anchors) {{
-            const href = a.getAttribute('href') || "";
-            if (href.includes('/groups/{GROUP_ID}/user/')) {{
-              groupUser.push(href);
-            }}
-          }}
-          let best = null;
-          let bestLen = 1e9;
-          for (const h of groupUser) {{
-            const base = h.split('?',1)[0];
-            if (base.length < bestLen) {{ bestLen = base.length; best = base; }}
-          }}
-          return {{ groupUserCount: groupUser.length, bestGroupUserHref: best }};
-        }}
-        """
-    )
+    data = page.evaluate(SEARCH_MEMBER_JS, GROUP_ID)
 
     print(f"[*] search found group user links: {data.get('groupUserCount', 0)}")
     best_href = data.get("bestGroupUserHref")
@@ -279,29 +401,15 @@ def harvest_post_links_from_member(page, member_url: str, out_links: Path) -> di
     rounds = 0
 
     page.goto(member_url, wait_until="domcontentloaded", timeout=POST_NAV_TIMEOUT_MS)
-    time.sleep(3.0)
+    wait_for_selector_best_effort(page, '[role="article"]', PAGE_READY_TIMEOUT_MS)
 
-    with out_links.open("a", encoding="utf-8") as f:
+    with JsonlWriter(out_links) as w:
         while True:
             rounds += 1
             click_see_more(page)
 
-            hrefs = page.evaluate(
-                f"""
-                () => {{
-                  const out = new Set();
-                  const anchors = Array.from(document.querySelectorAll('a[href]'));
-                  for (const a of anchors) {{
-                    const h = a.getAttribute('href');
-                    if (!h) continue;
-                    const base = h.split('?', 1)[0];
-                    if (base.includes('/groups/{GROUP_ID}/posts/')) out.add(base);
-                    if (base.includes('/groups/{GROUP_ID}/permalink/')) out.add(base);
-                  }}
-                  return Array.from(out);
-                }}
-                """
-            ) or []
+            harvested = page.evaluate(HARVEST_LINKS_JS, GROUP_ID) or {}
+            hrefs = harvested.get("hrefs") or []
 
             new_round = 0
             for h in hrefs:
@@ -312,16 +420,12 @@ def harvest_post_links_from_member(page, member_url: str, out_links: Path) -> di
                     continue
                 seen.add(full)
 
-                f.write(json.dumps(
-                    {
-                        "permalink": full,
-                        "captured_at": now_iso(),
-                        "source": "member_page",
-                        "expected_author": TARGET_AUTHOR,
-                    },
-                    ensure_ascii=False
-                ) + "\n")
-                f.flush()
+                w.write({
+                    "permalink": full,
+                    "captured_at": now_iso(),
+                    "source": "member_page",
+                    "expected_author": TARGET_AUTHOR,
+                })
                 new_round += 1
                 new_total += 1
 
@@ -329,10 +433,11 @@ def harvest_post_links_from_member(page, member_url: str, out_links: Path) -> di
                     break
 
             if new_round:
+                w.flush()  # once per round, not per link
                 last_new_time = time.monotonic()
 
             if rounds % 5 == 0 or new_round:
-                arts = page.evaluate("() => document.querySelectorAll('[role=\"article\"]').length") or 0
+                arts = harvested.get("articles") or 0
                 mins_no_new = (time.monotonic() - last_new_time) / 60.0
                 mins_total = (time.monotonic() - started) / 60.0
                 print(
@@ -353,9 +458,19 @@ def harvest_post_links_from_member(page, member_url: str, out_links: Path) -> di
                 print("[*] stop: no new links for HARVEST_NO_NEW_MINUTES")
                 break
 
-            # Scroll
-            scroll_best_effort(page)
-            time.sleep(SCROLL_PAUSE_SEC)
+            # Scroll, then wait for the feed to grow (at most SCROLL_PAUSE_SEC).
+            # Polls one scalar every 250 ms rather than counting articles
+            # across the whole DOM on every animation frame.
+            scrolled = scroll_best_effort(page) or {}
+            try:
+                page.wait_for_function(
+                    "n => document.scrollingElement.scrollHeight > n",
+                    arg=scrolled.get("doc_sh") or 0,
+                    polling=250,
+                    timeout=SCROLL_PAUSE_SEC * 1000,
+                )
+            except PlaywrightTimeoutError:
+                pass
 
     return {
         "new_links": new_total,
@@ -369,8 +484,16 @@ def harvest_post_links_from_member(page, member_url: str, out_links: Path) -> di
 # Phase 2: mbasic extraction (author + timestamp + cleaned text)
 # ============================================================
 MBASIC_EXTRACT_JS = r"""
-() => {
-  const norm = s => (s || "").replace(/\s+/g, " ").trim();
+(opts) => {
+  // Regexes and lookup sets are built once per call, never per element.
+  const WS_RE = /\s+/g;
+  const NAME_START_RE = /^[A-Za-z]/;
+  const norm = s => (s || "").replace(WS_RE, " ").trim();
+
+  // Candidates come from the story container when there is one, so page
+  // chrome (header/footer/nav links) neither costs time nor takes slots.
+  const root = document.querySelector('#m_story_permalink_view')
+    || document.querySelector('div[role="main"]') || document.body || document;
 
   const bodyText = norm(document.body ? document.body.innerText : "");
   const lower = bodyText.toLowerCase();
@@ -378,10 +501,31 @@ MBASIC_EXTRACT_JS = r"""
   if (lower.includes("you must log in") || (lower.includes("log in") && lower.includes("password"))) hints.push("login_wall");
   if (lower.includes("content not found") || lower.includes("page isn't available")) hints.push("content_unavailable");
 
-  const anchors = Array.from(document.querySelectorAll('a[href]'))
-    .slice(0, 260)
-    .map(a => ({ text: norm(a.innerText), href: a.href || "" }))
-    .filter(a => a.text && a.href);
+  // Author candidates are only collected when Python will score them, and
+  // are pre-filtered here with the scorer's own cheap rejections (bad text,
+  // not name-shaped unless it contains the expected author). idx keeps the
+  // position among the non-empty ones of the first 80 anchors, which the
+  // score depends on.
+  const anchors = [];
+  if (opts.anchors) {
+    const bad = new Set(opts.bad);
+    const exp = opts.expected;
+    const all = root.querySelectorAll('a[href]');
+    const n = Math.min(all.length, 80);
+    let idx = -1;
+    for (let j = 0; j < n; j++) {
+      const a = all[j];
+      const href = a.href || "";
+      const text = norm(a.innerText);
+      if (!text || !href) continue;
+      idx++;
+      const low = text.toLowerCase();
+      if (bad.has(low)) continue;
+      if (!low.includes(exp) &&
+          (text.length < 3 || text.length > 80 || !text.includes(" ") || !NAME_START_RE.test(text))) continue;
+      anchors.push({ text, href, idx });
+    }
+  }
 
   const abbrs = Array.from(document.querySelectorAll('abbr')).slice(0, 12);
   let ts_text = "";
@@ -398,13 +542,21 @@ MBASIC_EXTRACT_JS = r"""
     if (ts_utime || ts_title) break;
   }
 
-  // Try to pick the biggest meaningful block
-  const blocks = Array.from(document.querySelectorAll('p, div'))
-    .map(el => norm(el.innerText))
-    .filter(t => t && t.length >= 50 && t.length <= 30000);
+  // Try to pick the biggest meaningful block. innerText forces layout per
+  // element, so rank blocks by textContent length (no layout) and only read
+  // innerText of the largest few that pass the size filter.
+  const TOP_K = 5;
+  const els = Array.from(root.querySelectorAll('p, div'));
+  const sizes = els.map(el => (el.textContent || "").length);
+  const order = els.map((_, i) => i).sort((a, b) => sizes[b] - sizes[a]);
 
   let best = "";
-  for (const t of blocks) {
+  let taken = 0;
+  for (const i of order) {
+    if (taken >= TOP_K || !sizes[i]) break;
+    const t = norm(els[i].innerText);
+    if (!t || t.length < 50 || t.length > 30000) continue;
+    taken++;
     if (t.length > best.length) best = t;
   }
 
@@ -413,54 +565,67 @@ MBASIC_EXTRACT_JS = r"""
 """
 
 
-def score_author_candidates(cands: list[dict], expected_author: str) -> tuple[str, str, list[dict]]:
-    expected_cf = (expected_author or "").casefold()
-    bad_text = {
-        "like","comment","share","more","full story","see translation","reply","react",
-        "home","groups","watch","marketplace"
-    }
+AUTHOR_BAD_TEXT = frozenset({
+    "like","comment","share","more","full story","see translation","reply","react",
+    "home","groups","watch","marketplace"
+})
+_AUTHOR_BAD_TEXT_JS = sorted(AUTHOR_BAD_TEXT)  # MBASIC_EXTRACT_JS argument
+
+# (href substring, score delta) applied to every candidate href.
+AUTHOR_HREF_BONUS = (("profile.php", 120), ("/people/", 80))
+AUTHOR_HREF_PENALTY_NEEDLES = ("comment", "reply", "reaction", "share")
+
 
-    def looks_like_name(t: str) -> bool:
-        t = t.strip()
-        if len(t) < 3 or len(t) > 80:
-            return False
-        parts = t.split()
-        if len(parts) < 2:
-            return False
-        if not re.match(r"^[A-Za-z]", t):
-            return False
-        return True
+def looks_like_name(t: str) -> bool:
+    t = t.strip()
+    if len(t) < 3 or len(t) > 80:
+        return False
+    parts = t.split()
+    if len(parts) < 2:
+        return False
+    if not _ALPHA_START_RE.match(t):
+        return False
+    return True
+
+
+def score_author_candidates(
+    cands: list[dict], expected_author: str, expected_cf: str | None = None
+) -> tuple[str, str, list[dict]]:
+    if expected_cf is None:
+        expected_cf = (expected_author or "").casefold()
 
     scored = []
     for i, c in enumerate(cands):
+        i = c.get("idx", i)  # page position, when the browser pre-filtered
         text = norm_ws(c.get("text", ""))
         href = c.get("href", "") or ""
         if not text or not href:
             continue
+        # text/href are casefolded/lowered exactly once per candidate.
         t_cf = text.casefold()
-        if t_cf in bad_text:
+        if t_cf in AUTHOR_BAD_TEXT:
             continue
-        if not looks_like_name(text) and expected_cf not in t_cf:
+        expected_hit = expected_cf in t_cf
+        if not expected_hit and not looks_like_name(text):
             continue
 
         score = 0
         score += max(0, 250 - i)
 
         h = href.lower()
-        if "profile.php" in h:
-            score += 120
-        if "/people/" in h:
-            score += 80
-        if re.search(r"facebook\.com/[^/?]+/?$", h):
+        for needle, delta in AUTHOR_HREF_BONUS:
+            if needle in h:
+                score += delta
+        if _FB_TAIL_RE.search(h):
             score += 60
 
-        if any(x in h for x in ["comment", "reply", "reaction", "share"]):
+        if any(x in h for x in AUTHOR_HREF_PENALTY_NEEDLES):
             score -= 120
 
-        if expected_cf and expected_cf in t_cf:
+        if expected_cf and expected_hit:
             score += 300
 
-        if re.match(r"^[A-Z][a-z]+ [A-Z][a-z]+", text):
+        if _TWO_NAME_RE.match(text):
             score += 30
 
         scored.append({"score": score, "text": text, "href": href, "idx": i})
@@ -475,27 +640,37 @@ def score_author_candidates(cands: list[dict], expected_author: str) -> tuple[st
 def scrape_one_post_mbasic(page, url: str, expected_author: str) -> dict:
     mbasic_url = make_mbasic_url(url)
     page.goto(mbasic_url, wait_until="domcontentloaded", timeout=POST_NAV_TIMEOUT_MS)
-    time.sleep(POST_PAGE_WAIT_SEC)
-    click_see_more(page)
-
-    mb = page.evaluate(MBASIC_EXTRACT_JS) or {}
+    wait_for_selector_best_effort(page, POST_READY_SELECTOR, POST_READY_TIMEOUT_MS)
+    click_see_more(page, max_clicks=1)  # a single post has one "See more"
+
+    assume_author = ASSUME_AUTHOR_FROM_MEMBER_PAGE and bool(expected_author)
+    # Harvested links nearly always carry TARGET_AUTHOR; reuse its casefold.
+    expected_cf = _TARGET_AUTHOR_CF if expected_author == TARGET_AUTHOR else expected_author.casefold()
+    mb = page.evaluate(MBASIC_EXTRACT_JS, {
+        "anchors": not assume_author,
+        "bad": _AUTHOR_BAD_TEXT_JS,
+        # JS lowercases, Python casefolds; they only agree for ASCII, so
+        # otherwise let every candidate through the expected-author check.
+        "expected": expected_cf if expected_cf.isascii() else "",
+    }) or {}
     hints = mb.get("hints") or []
 
-    raw_text = (mb.get("text") or "").strip()
-    text = clean_mbasic_text(raw_text)
+    text = clean_mbasic_text(mb.get("text"))  # strips/handles None itself
 
     ts_text = norm_ws(mb.get("ts_text") or "")
     ts_title = norm_ws(mb.get("ts_title") or "")
     ts_utime = norm_ws(mb.get("ts_utime") or "")
     ts_iso = utime_to_iso(ts_utime) if ts_utime else ""
 
-    anchors = mb.get("anchors") or []
-    author, author_href, top = score_author_candidates(anchors, expected_author)
-
-    author_source = "mbasic_scored"
-    if not author and ASSUME_AUTHOR_FROM_MEMBER_PAGE and expected_author:
-        author = expected_author
+    if assume_author:
+        # Links harvested from the member page are the author's own posts:
+        # take the expected author and skip scoring the anchors altogether.
+        author, author_href, top = expected_author, "", []
         author_source = "assumed_expected_author"
+    else:
+        anchors = mb.get("anchors") or []
+        author, author_href, top = score_author_candidates(anchors, expected_author, expected_cf)
+        author_source = "mbasic_scored"
 
     timestamp = ts_iso or ts_title or ts_text
 
@@ -515,26 +690,89 @@ def scrape_one_post_mbasic(page, url: str, expected_author: str) -> dict:
     }
 
 
-def scrape_posts(page, in_links: Path, out_all: Path, out_filtered: Path, out_success: Path) -> dict:
-    success = load_jsonl_keys(out_success, "permalink")
-    link_meta = load_jsonl_map(in_links, "permalink")
-    links = list(link_meta.keys())
+def _abort_heavy_resource(route) -> None:
+    if route.request.resource_type in PHASE2_BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def block_heavy_resources(ctx) -> None:
+    # Phase 2 only: Phase 1 scrolls the full www UI, which needs its styles.
+    ctx.route("**/*", _abort_heavy_resource)
+
+
+def _scrape_worker(post_queue: queue.Queue, record, storage_state: Path) -> None:
+    # Playwright's sync API is per-thread: each worker owns its own driver,
+    # browser and context, logged in via the storage state exported by main().
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=HEADLESS)
+        try:
+            ctx = browser.new_context(storage_state=str(storage_state), viewport={"width": 1280, "height": 900})
+            block_heavy_resources(ctx)
+            page = ctx.new_page()
+            _drain_queue(post_queue, record, page)
+        finally:
+            browser.close()
+
+
+def _drain_queue(post_queue: queue.Queue, record, page) -> None:
+    while True:
+        try:
+            url = post_queue.get_nowait()
+        except queue.Empty:
+            return
+        record(page, url)
+
+
+def scrape_posts(
+    page,
+    in_links: Path,
+    out_all: Path,
+    out_filtered: Path,
+    out_success: Path,
+    workers: int = 1,
+    storage_state: Path | None = None,
+) -> dict:
+    """
+    Scrape every not-yet-successful permalink. With workers > 1 (requires
+    storage_state), `page` plus workers-1 extra browser contexts pull from one
+    shared queue; page loads are network-bound, so they overlap K-way.
+    Output writes, counters and debug dumps are serialized under one lock.
+    """
+    success = load_permalinks(out_success)
+    # Only expected_author is needed per link; normalize it once here.
+    expected_by_url = {
+        url: (meta.get("expected_author") or "").strip()
+        for url, meta in load_jsonl_map(in_links, "permalink").items()
+    }
+    links = list(expected_by_url)
 
     print(f"[*] Phase 2: loaded {len(links)} permalinks. success_already={len(success)}")
 
-    failures_dumped = 0
-    attempted = 0
-    wrote = 0
+    pending = [url for url in links if url not in success]
+    if len(pending) > MAX_POST_PAGES_TO_SCRAPE:
+        print("[*] stop: MAX_POST_PAGES_TO_SCRAPE")
+        pending = pending[:MAX_POST_PAGES_TO_SCRAPE]
 
-    for url in links:
-        if url in success:
-            continue
-        attempted += 1
-        if attempted > MAX_POST_PAGES_TO_SCRAPE:
-            print("[*] stop: MAX_POST_PAGES_TO_SCRAPE")
-            break
+    lock = threading.Lock()
+    stats = {"attempted": 0, "wrote": 0, "failures_dumped": 0}
 
-        expected_author = (link_meta.get(url, {}).get("expected_author") or "").strip()
+    # Opened below, for the duration of the scrape; record() writes to them.
+    w_all = w_filtered = w_success = None
+
+    def flush_outputs() -> None:
+        # Success markers last: a crash between flushes can then only lose
+        # markers (post re-scraped next run), never claim an unwritten post.
+        w_all.flush()
+        w_filtered.flush()
+        w_success.flush()
+
+    def record(page, url: str) -> None:
+        with lock:
+            stats["attempted"] += 1
+
+        expected_author = expected_by_url.get(url, "")
 
         try:
             result = scrape_one_post_mbasic(page, url, expected_author)
@@ -547,11 +785,13 @@ def scrape_posts(page, in_links: Path, out_all: Path, out_filtered: Path, out_su
 
             # IMPORTANT: only write non-empty posts to posts_all.jsonl
             if not text:
-                if failures_dumped < MAX_DEBUG_FAILURE_ARTIFACTS:
-                    failures_dumped += 1
-                    print(f"[!] EMPTY after mbasic -> dumping artifacts #{failures_dumped} hints={hints} url={url}")
-                    dump_failure_artifacts(page, failures_dumped)
-                continue
+                with lock:
+                    if stats["failures_dumped"] < MAX_DEBUG_FAILURE_ARTIFACTS:
+                        stats["failures_dumped"] += 1
+                        n = stats["failures_dumped"]
+                        print(f"[!] EMPTY after mbasic -> dumping artifacts #{n} hints={hints} url={url}")
+                        dump_failure_artifacts(page, n)
+                return
 
             rec = {
                 "permalink": url,
@@ -569,28 +809,57 @@ def scrape_posts(page, in_links: Path, out_all: Path, out_filtered: Path, out_su
                 "mbasic_url": result.get("mbasic_url") or "",
             }
 
-            append_jsonl(out_all, rec)
-            wrote += 1
-
-            # Filter file (usually redundant for Sean-only scope)
-            if not TARGET_AUTHOR or (TARGET_AUTHOR.casefold() in author.casefold()):
-                append_jsonl(out_filtered, rec)
-
-            append_jsonl(out_success, {"permalink": url, "captured_at": now_iso(), "source": source})
-            success.add(url)
-
-            if wrote <= DEBUG_FIRST_N:
-                tops = result.get("author_candidates_top") or []
-                print(f"[DEBUG] {wrote} source={source} author={author!r} ts={ts!r} text_len={len(text)} hints={hints}")
-                if tops:
-                    print("        top author candidates:")
-                    for c in tops[:5]:
-                        print(f"          score={c['score']:>4} text={c['text']!r} href={c['href'][:80]}...")
+            line = jsonl_line(rec)  # encoded once, outside the lock
+            with lock:
+                w_all.write_line(line)
+                stats["wrote"] += 1
+                wrote = stats["wrote"]
+
+                # Filter file (usually redundant for Sean-only scope)
+                if not TARGET_AUTHOR or (_TARGET_AUTHOR_CF in author.casefold()):
+                    w_filtered.write_line(line)
+
+                w_success.write({"permalink": url, "captured_at": now_iso(), "source": source})
+                success.add(url)
+                if wrote % OUTPUT_FLUSH_EVERY == 0:
+                    flush_outputs()
+
+                if wrote <= DEBUG_FIRST_N:
+                    tops = result.get("author_candidates_top") or []
+                    print(f"[DEBUG] {wrote} source={source} author={author!r} ts={ts!r} text_len={len(text)} hints={hints}")
+                    if tops:
+                        print("        top author candidates:")
+                        for c in tops[:5]:
+                            print(f"          score={c['score']:>4} text={c['text']!r} href={c['href'][:80]}...")
 
         except Exception as e:
-            print(f"[!] error scraping: {e} | {url}")
-            continue
-
+            with lock:
+                print(f"[!] error scraping: {e} | {url}")
+
+    post_queue: queue.Queue = queue.Queue()
+    for url in pending:
+        post_queue.put(url)
+
+    workers = max(1, min(workers, len(pending))) if storage_state is not None else 1
+    threads = [
+        threading.Thread(target=_scrape_worker, args=(post_queue, record, storage_state), daemon=True)
+        for _ in range(workers - 1)
+    ]
+    with contextlib.ExitStack() as stack:
+        w_all = stack.enter_context(JsonlWriter(out_all))
+        w_filtered = stack.enter_context(JsonlWriter(out_filtered))
+        w_success = stack.enter_context(JsonlWriter(out_success))
+        try:
+            for t in threads:
+                t.start()
+            # The caller's (already logged-in) page is worker #1.
+            _drain_queue(post_queue, record, page)
+            for t in threads:
+                t.join()
+        finally:
+            flush_outputs()
+
+    attempted, wrote = stats["attempted"], stats["wrote"]
     print(f"[*] Phase 2 done. attempted={attempted} wrote={wrote} success_total={len(success)}")
     return {"attempted": attempted, "wrote": wrote, "success_total": len(success)}
 
@@ -599,6 +868,11 @@ def scrape_posts(page, in_links: Path, out_all: Path, out_filtered: Path, out_su
 # Main
 # ============================================================
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--workers", type=int, default=SCRAPE_WORKERS,
+                    help="parallel browser contexts for Phase 2 post scraping")
+    args = ap.parse_args()
+
     OUTPUT_DIR.mkdir(exist_ok=True)
 
     out_links = OUTPUT_DIR / "post_links_sean.jsonl"
@@ -638,7 +912,24 @@ def main():
             return
 
         print("[*] Phase 2: scraping post permalinks via mbasic")
-        scrape_stats = scrape_posts(page, out_links, out_all, out_filtered, out_success)
+        block_heavy_resources(ctx)
+        storage_state = None
+        try:
+            if args.workers > 1:
+                # Extra workers get their own contexts; hand them this session's login.
+                # It holds the session cookies: keep it in a private (0600) temp
+                # file, never next to the scraped output.
+                fd, state_path = tempfile.mkstemp(prefix="playwright_storage_state_", suffix=".json")
+                storage_state = Path(state_path)
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(ctx.storage_state(), f)
+            scrape_stats = scrape_posts(
+                page, out_links, out_all, out_filtered, out_success,
+                workers=args.workers, storage_state=storage_state,
+            )
+        finally:
+            if storage_state is not None:
+                storage_state.unlink(missing_ok=True)
         run_meta["phase2"] = scrape_stats
 
         ctx.close()
@@ -13,12 +13,37 @@ This step:
 Step 4 output remains UNTOUCHED and byte-identical.
 """
 import argparse
+import hashlib
 import json
+import multiprocessing
+import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used as a drop-in fallback
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:  # optional; the fused `re` alternation gates every body
+    hyperscan = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # optional; the topics CSV is then read with csv.reader
+    pa = None
+
+_loads = orjson.loads if orjson is not None else json.loads
 
 
 # Fixed category set (v1 lock)
@@ -31,6 +56,7 @@ SELF_PORTRAYAL_CATEGORIES = [
     "personal_responsibility",
     "other"
 ]
+CATEGORY_INDEX: Dict[str, int] = {cat: i for i, cat in enumerate(SELF_PORTRAYAL_CATEGORIES)}
 
 # Patterns for detecting self-portrayal claims by category
 # Each pattern must be FIRST-PERSON and EXPLICIT (no "we X" group claims)
@@ -75,6 +101,80 @@ CATEGORY_PATTERNS: Dict[str, List[re.Pattern]] = {
     ],
 }
 
+# All patterns fused into one alternation: a single scan per item tells whether
+# ANY pattern matches, and most bodies match none and skip the per-category
+# loop. It only gates that loop: excerpts must come from the first matching
+# pattern of each category, which one non-overlapping scan cannot provide.
+# Every pattern opens with \b; it is factored out so the engine checks the
+# word boundary once per position instead of once per alternative. The
+# alternatives are deliberately unnamed: a leading group marker would stop
+# the engine from skipping branches whose first literal cannot match.
+assert all(p.pattern.startswith(r"\b") for ps in CATEGORY_PATTERNS.values() for p in ps)
+ANY_CATEGORY_PATTERN: re.Pattern = re.compile(
+    r"\b(?:"
+    + "|".join(p.pattern[2:] for patterns in CATEGORY_PATTERNS.values() for p in patterns)
+    + ")",
+    re.I,
+)
+
+
+# Necessary condition for ANY_CATEGORY_PATTERN: every pattern contains a
+# standalone "i" (followed by ' or a space, or i\b) or a standalone "me"
+# (the they/no one ... me\b and "trust me" patterns). A body with neither is
+# rejected by this much cheaper scan before the 24-way alternation runs.
+FIRST_PERSON_HINT: re.Pattern = re.compile(r"\b(?:i|me)\b", re.I)
+
+
+def _compile_hyperscan_gate() -> Optional[Any]:
+    """
+    Compile CATEGORY_PATTERNS into one Hyperscan block-mode database (all
+    patterns scanned simultaneously). None when hyperscan is not installed
+    or rejects a pattern.
+    """
+    if hyperscan is None:
+        return None
+    expressions = [p.pattern.encode("ascii") for ps in CATEGORY_PATTERNS.values() for p in ps]
+    n = len(expressions)
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        db.compile(
+            expressions=expressions,
+            ids=list(range(n)),
+            elements=n,
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * n,
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+# Set by load_hyperscan_gate() (from the on-disk cache when possible) before
+# the scan; while None, may_contain_claim uses the `re` gate.
+HYPERSCAN_GATE: Optional[Any] = None
+
+
+def _stop_scan(*_: Any) -> bool:
+    return True  # first hit answers the question; terminate the scan
+
+
+def may_contain_claim(body: str) -> bool:
+    """
+    True if any CATEGORY_PATTERNS pattern matches somewhere in body.
+
+    Hyperscan's caseless/word-boundary rules are ASCII, so it only answers for
+    ASCII bodies (where they agree with `re`); anything else uses the fused
+    `re` alternation behind the FIRST_PERSON_HINT prefilter.
+    """
+    if HYPERSCAN_GATE is not None and body.isascii():
+        try:
+            HYPERSCAN_GATE.scan(body.encode("ascii"), match_event_handler=_stop_scan)
+        except hyperscan.ScanTerminated:
+            return True
+        return False
+    if not FIRST_PERSON_HINT.search(body):
+        return False
+    return ANY_CATEGORY_PATTERN.search(body) is not None
+
 
 def log(msg: str) -> None:
     """Minimal logging."""
@@ -95,50 +195,105 @@ def load_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def load_jsonl(path: Path) -> List[Dict[str, Any]]:
-    """Load JSONL file."""
+READ_BUFFER = 1 << 20
+
+
+def open_sequential(path: Path) -> BinaryIO:
+    """
+    Open path for one front-to-back pass: binary, with a 1 MiB buffer (far
+    fewer read syscalls than the 8 KiB default) and, where the platform has
+    it, a hint to the kernel to read ahead aggressively.
+    """
+    f = open(path, "rb", buffering=READ_BUFFER)
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # advisory only
+    return f
+
+
+def iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream JSONL records one at a time."""
     if not path.exists():
         fail(f"File not found: {path}")
-    items = []
-    with open(path, encoding="utf-8") as f:
+    # Raw bytes lines go straight to the parser (both orjson and json accept
+    # UTF-8 bytes), skipping a decode to str and the Unicode-aware strip
+    with open_sequential(path) as f:
         for line in f:
             line = line.strip()
             if line:
-                items.append(json.loads(line))
-    return items
+                yield _loads(line)
 
 
-def detect_self_portrayal_claims(
-    normalized_items: List[Dict[str, Any]],
-    topic_assignments: Dict[str, str]
-) -> Dict[str, Any]:
+class Example(NamedTuple):
+    """One self-portrayal example; converted to its schema dict on output."""
+    item_id: str
+    timestamp: Any
+    topic: str
+    category: str
+    excerpt: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "item_id": self.item_id,
+            "timestamp": self.timestamp,
+            "topic": self.topic,
+            "claim_category": self.category,
+            "excerpt": self.excerpt
+        }
+
+
+def scan_self_portrayal_claims(
+    normalized_items: Iterable[Dict[str, Any]],
+    topic_assignments: Dict[str, str],
+    counts_only: bool = False
+) -> Tuple[Dict[str, int], List[Example]]:
     """
-    Detect self-portrayal claims in normalized items.
-    
-    Returns self_portrayal object per schema, or structure with zero claims.
+    Scan items for self-portrayal claims: per-category counts plus every
+    example, in item order (not yet deduplicated or sorted). With
+    counts_only, no examples are built (counts are unchanged).
     """
-    categories: Dict[str, int] = {cat: 0 for cat in SELF_PORTRAYAL_CATEGORIES}
-    examples: List[Dict[str, Any]] = []
+    # Counters in a list indexed by category position (an indexed store
+    # instead of a dict hash lookup per hit); turned into the dict at the end
+    counts = [0] * len(SELF_PORTRAYAL_CATEGORIES)
+    examples: List[Example] = []
+    
+    # Loop invariants bound to locals once instead of looked up per item
+    category_patterns = tuple(
+        (CATEGORY_INDEX[category], category, patterns) for category, patterns in CATEGORY_PATTERNS.items()
+    )
+    gate = may_contain_claim
+    topic_of = topic_assignments.get
+    add_example = examples.append
     
     for item in normalized_items:
-        body = item.get("body", "") or ""
+        get = item.get
+        body = get("body", "") or ""
         
         # Item ID correctness: use 'permalink' (our schema) else 'id' else 'item_id' else FAIL LOUD
-        item_id = item.get("permalink") or item.get("id") or item.get("item_id") or ""
+        # (checked for every item; the `or` chain stops at the first truthy key)
+        item_id = get("permalink") or get("id") or get("item_id") or ""
         if not item_id:
             fail(f"Normalized item missing permalink/id/item_id: cannot produce traceable examples")
         
-        timestamp = item.get("timestamp_parsed") or item.get("timestamp")  # May be null
-        
-        # Get topic for this item (topics CSV may use 'i' index or 'permalink')
-        topic = topic_assignments.get(item_id, "uncategorized")
-        
+        if not gate(body):
+            continue
+
+        # Only items with a possible claim need their timestamp and topic,
+        # and only for examples
+        if not counts_only:
+            timestamp = get("timestamp_parsed") or get("timestamp")  # May be null
+            
+            # Get topic for this item (topics CSV may use 'i' index or 'permalink')
+            topic = topic_of(item_id, "uncategorized")
+
         # Check each category's patterns
-        for category, patterns in CATEGORY_PATTERNS.items():
+        for ci, category, patterns in category_patterns:
             for pattern in patterns:
                 match = pattern.search(body)
                 if match:
-                    categories[category] += 1
+                    counts[ci] += 1
                     
                     # Extract STRICTLY VERBATIM excerpt (exact match only, no modifications)
                     excerpt = match.group(0)
@@ -148,28 +303,31 @@ def detect_self_portrayal_claims(
                         continue
                     
                     # Add example
-                    examples.append({
-                        "item_id": item_id,
-                        "timestamp": timestamp,
-                        "topic": topic,
-                        "claim_category": category,
-                        "excerpt": excerpt
-                    })
+                    if not counts_only:
+                        add_example(Example(item_id, timestamp, topic, category, excerpt))
                     
                     # Only count once per category per item
                     break
+
+    categories: Dict[str, int] = dict(zip(SELF_PORTRAYAL_CATEGORIES, counts))
+    return categories, examples
+
+
+def build_self_portrayal(categories: Dict[str, int], examples: List[Example]) -> Dict[str, Any]:
+    """
+    Build the self_portrayal object per schema from scan results, or
+    structure with zero claims.
+    """
+    # Deduplicate examples by (item_id, category), first occurrence wins (an
+    # item listed in two normalized files yields the same example twice):
+    # filling the dict in reverse leaves each key holding its earliest example
+    by_key = {(ex.item_id, ex.category): ex for ex in reversed(examples)}
     
-    # Deduplicate examples by (item_id, category) and limit to reasonable set
-    seen = set()
-    unique_examples = []
-    for ex in examples:
-        key = (ex["item_id"], ex["claim_category"])
-        if key not in seen:
-            seen.add(key)
-            unique_examples.append(ex)
-    
-    # Sort examples by item_id for determinism
-    unique_examples.sort(key=lambda x: (x["item_id"], x["claim_category"]))
+    # Sort examples by (item_id, category) for determinism: two stable
+    # single-field sorts (minor key first) give the same order, and plain str
+    # keys take CPython's fast string-compare path that tuple keys cannot
+    unique_examples = sorted(by_key.values(), key=attrgetter("category"))
+    unique_examples.sort(key=attrgetter("item_id"))
     
     # Note: No example cap in v1 - spec does not explicitly allow sampling
     
@@ -179,10 +337,75 @@ def detect_self_portrayal_claims(
         "schema_version": "self_portrayal_v1",
         "total_claims": total_claims,
         "categories": categories,
-        "examples": unique_examples
+        "examples": [ex.to_dict() for ex in unique_examples]
     }
 
 
+def detect_self_portrayal_claims(
+    normalized_items: Iterable[Dict[str, Any]],
+    topic_assignments: Dict[str, str],
+    counts_only: bool = False
+) -> Dict[str, Any]:
+    """
+    Detect self-portrayal claims in normalized items.
+    
+    Returns self_portrayal object per schema, or structure with zero claims
+    (and an empty examples list when counts_only).
+    """
+    return build_self_portrayal(*scan_self_portrayal_claims(normalized_items, topic_assignments, counts_only))
+
+
+_TOPIC_DELIM = re.compile(r"[|,]")
+
+
+def primary_topic(topics: str) -> str:
+    """Primary topic of one topics cell ('' counts as 'uncategorized')."""
+    topics = topics or "uncategorized"
+    # Compliance fix: Handle both | and , delimiters (legacy vs new)
+    # Deterministically pick first non-empty token; usually the head
+    # of a single maxsplit=1 split already is it
+    primary = _TOPIC_DELIM.split(topics, 1)[0].strip()
+    if not primary:
+        primary = next(
+            (t for t in map(str.strip, _TOPIC_DELIM.split(topics)) if t),
+            "uncategorized",
+        )
+    # Topics are a small closed set: intern so every assignment (and
+    # every example built from it) shares one string per topic
+    return sys.intern(primary)
+
+
+def _topic_assignments_arrow(topics_csv_path: Path, header: List[str]) -> Optional[Dict[str, str]]:
+    """
+    build_topic_assignments on pyarrow's C++ CSV reader. Only the permalink
+    and topics columns are materialized, and the topics column is
+    dictionary-encoded so primary_topic runs once per distinct cell value
+    instead of once per row. None if pyarrow rejects the file (e.g. ragged
+    rows, which csv.reader tolerates); the caller then uses csv.reader.
+    """
+    try:
+        table = pa_csv.read_csv(
+            topics_csv_path,
+            # Column names exactly as csv.reader saw them, so both readers
+            # resolve the same columns
+            read_options=pa_csv.ReadOptions(column_names=header, skip_rows=1),
+            parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=["permalink", "topics"],
+                include_missing_columns=True,
+                column_types={"permalink": pa.string(), "topics": pa.string()},
+                strings_can_be_null=False,
+            ),
+        )
+    except (pa.ArrowInvalid, pa.ArrowKeyError):
+        return None
+    table = table.filter(pc.not_equal(table.column("permalink"), ""))  # Skip rows without permalink
+    topics = pc.fill_null(table.column("topics"), "").combine_chunks().dictionary_encode()
+    primaries = [primary_topic(t) for t in topics.dictionary.to_pylist()]
+    # Later rows overwrite earlier ones, as in the csv.reader loop
+    return dict(zip(table.column("permalink").to_pylist(), map(primaries.__getitem__, topics.indices.to_pylist())))
+
+
 def build_topic_assignments(topics_csv_path: Path) -> Dict[str, str]:
     """
     Build mapping of permalink -> primary topic from topics CSV.
@@ -195,34 +418,220 @@ def build_topic_assignments(topics_csv_path: Path) -> Dict[str, str]:
     if not topics_csv_path.exists():
         return assignments
     
+    def column(header: List[str], name: str) -> Optional[int]:
+        # Last occurrence wins, as with csv.DictReader's row dicts
+        for i in range(len(header) - 1, -1, -1):
+            if header[i] == name:
+                return i
+        return None
+
     with open(topics_csv_path, encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        # Plain csv.reader with the two column indices resolved once from the
+        # header: no per-row dict for a CSV where only two columns matter.
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return assignments
+        # Use 'permalink' as the key to match normalized items
+        pi = column(header, "permalink")
+        ti = column(header, "topics")
+        if pi is None:
+            return assignments  # no row can have a permalink
+        if pa is not None and len(set(header)) == len(header):
+            arrow_assignments = _topic_assignments_arrow(topics_csv_path, header)
+            if arrow_assignments is not None:
+                return arrow_assignments
         for row in reader:
-            # Use 'permalink' as the key to match normalized items
-            item_id = row.get("permalink", "")
+            if not row:
+                continue  # blank line (DictReader skips these too)
+            item_id = row[pi] if pi < len(row) else ""
             if not item_id:
                 continue  # Skip rows without permalink
-            topics = row.get("topics", "uncategorized") or "uncategorized"
-
-            # Compliance fix: Handle both | and , delimiters (legacy vs new)
-            # Deterministically pick first non-empty token
-            if '|' in topics:
-                parts = topics.split('|')
-            else:
-                parts = topics.split(',')
-            
-            primary = "uncategorized"
-            for p in parts:
-                cleaned = p.strip()
-                if cleaned:
-                    primary = cleaned
-                    break
-            
-            assignments[item_id] = primary
+            assignments[item_id] = primary_topic(row[ti] if ti is not None and ti < len(row) else "")
     
     return assignments
 
 
+# Artifacts that are costly to rebuild but only change with their inputs are
+# cached here, each stored with the key it was built from and rebuilt on any
+# mismatch (or unreadable file). Nothing in the directory is unpickled: the
+# topic map is JSON, the Hyperscan database a raw dumpb blob. Bump
+# CACHE_VERSION when the code that builds an artifact (or the format) changes.
+CACHE_DIRNAME = ".step5_cache"
+CACHE_VERSION = 2
+
+
+def _cache_key(*parts: Any) -> str:
+    return hashlib.sha256("\0".join(map(str, (CACHE_VERSION,) + parts)).encode("utf-8")).hexdigest()
+
+
+def _read_cache_bytes(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        log(f"  Ignoring unreadable cache {path.name}: {e}")
+        return None
+
+
+def _write_cache_bytes(path: Path, data: bytes) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # tmp + os.replace: a crash mid-write never leaves a torn cache behind.
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError as e:  # read-only tree etc.: the cache is an optimization
+        log(f"  Could not write cache {path.name}: {e}")
+
+
+def load_topic_assignments(topics_csv_path: Path, cache_dir: Optional[Path]) -> Dict[str, str]:
+    """
+    build_topic_assignments, memoized in cache_dir (None disables the cache)
+    on the CSV's resolved path, size and mtime.
+    """
+    if cache_dir is None or not topics_csv_path.exists():
+        return build_topic_assignments(topics_csv_path)
+    st = topics_csv_path.stat()
+    key = _cache_key("topics", topics_csv_path.resolve(), st.st_size, st.st_mtime_ns)
+    path = cache_dir / "topic_assignments.json"
+
+    # Stored as the distinct topics plus one index per permalink, so a load
+    # restores one shared (interned) string per topic, as built
+    data = _read_cache_bytes(path)
+    if data is not None:
+        try:
+            cached = _loads(data)
+            if cached["key"] == key:
+                topics = [sys.intern(t) for t in cached["topics"]]
+                permalinks, indices = cached["permalinks"], cached["topic_index"]
+                if len(permalinks) == len(indices):
+                    log("  (from cache)")
+                    return dict(zip(permalinks, map(topics.__getitem__, indices)))
+        except (ValueError, TypeError, KeyError, IndexError) as e:  # malformed: rebuild
+            log(f"  Ignoring malformed cache {path.name}: {e!r}")
+
+    assignments = build_topic_assignments(topics_csv_path)
+    topic_ids: Dict[str, int] = {}
+    cached = {
+        "key": key,
+        "permalinks": list(assignments),
+        "topic_index": [topic_ids.setdefault(t, len(topic_ids)) for t in assignments.values()],
+        "topics": list(topic_ids),
+    }
+    if orjson is not None:
+        data = orjson.dumps(cached)
+    else:
+        data = json.dumps(cached, ensure_ascii=False).encode("utf-8")
+    _write_cache_bytes(path, data)
+    return assignments
+
+
+def load_hyperscan_gate(cache_dir: Optional[Path]) -> None:
+    """
+    Set HYPERSCAN_GATE: the serialized database from cache_dir when it was
+    built from the current CATEGORY_PATTERNS by this hyperscan version, else
+    a fresh compile (then cached). No-op without hyperscan.
+    """
+    global HYPERSCAN_GATE
+    if hyperscan is None:
+        return
+    key = _cache_key(
+        "hyperscan",
+        getattr(hyperscan, "__version__", ""),
+        *(f"{p.pattern}\0{p.flags}" for ps in CATEGORY_PATTERNS.values() for p in ps),
+    )
+    # File layout: the hex key, a newline, then the hyperscan.dumpb blob
+    header = key.encode("ascii") + b"\n"
+    path = cache_dir / "hyperscan_gate.db" if cache_dir is not None else None
+    data = _read_cache_bytes(path) if path is not None else None
+    if data is not None and data.startswith(header):
+        try:
+            db = hyperscan.loadb(data[len(header):], hyperscan.HS_MODE_BLOCK)
+            db.scratch = hyperscan.Scratch(db)
+            HYPERSCAN_GATE = db
+            return
+        except hyperscan.error as e:  # e.g. built for another CPU/platform
+            log(f"  Ignoring cached Hyperscan database: {e}")
+    HYPERSCAN_GATE = _compile_hyperscan_gate()
+    if HYPERSCAN_GATE is not None and path is not None:
+        _write_cache_bytes(path, header + hyperscan.dumpb(HYPERSCAN_GATE))
+
+
+def _orjson_matches_stdlib(obj: Any) -> bool:
+    """
+    True if orjson renders every float in obj exactly as the stdlib does.
+    They differ on exponent notation (stdlib 1e-07 / 1e+16, orjson 1e-7 /
+    1e16 / 0.000025) and on non-finite values (stdlib NaN, orjson null).
+    """
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        if isinstance(x, float):
+            a = abs(x)
+            if a != a or a == float("inf") or (a and not 1e-4 <= a < 1e16):
+                return False
+        elif isinstance(x, dict):
+            stack.extend(x.values())
+        elif isinstance(x, list):
+            stack.extend(x)
+    return True
+
+
+def dump_report(report: Any) -> bytes:
+    """
+    Serialize the enriched report: sorted keys, 2-space indent, non-ASCII kept.
+    Uses orjson when its output would be byte-identical to the stdlib's
+    (see _orjson_matches_stdlib; values orjson rejects, e.g. ints beyond 64
+    bits, also fall back) so the output never depends on what is installed.
+    """
+    if orjson is not None and _orjson_matches_stdlib(report):
+        try:
+            return orjson.dumps(report, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(report, indent=2, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+# Stand-in for self_portrayal.examples while the rest of the report is encoded
+_EXAMPLES_SENTINEL = "\ue000step5:self_portrayal.examples\ue000"
+
+
+def write_report(report: Dict[str, Any], output_path: Path) -> None:
+    """
+    Write dump_report(report) to output_path, streaming the (potentially huge)
+    self_portrayal.examples list one element at a time instead of encoding the
+    whole report into one buffer. Bytes are identical to dump_report's.
+    """
+    sp = report.get("self_portrayal")
+    examples = sp.get("examples") if isinstance(sp, dict) else None
+    if not isinstance(examples, list) or not examples:
+        output_path.write_bytes(dump_report(report))
+        return
+
+    shell = dict(report)
+    shell["self_portrayal"] = dict(sp, examples=_EXAMPLES_SENTINEL)
+    head = dump_report(shell)
+    marker = dump_report(_EXAMPLES_SENTINEL)  # the sentinel as a JSON string
+    if head.count(marker) != 1:
+        output_path.write_bytes(dump_report(report))  # sentinel collision: no streaming
+        return
+    before, after = head.split(marker)
+    # Elements sit one indent level (2 spaces) deeper than the "examples" key
+    key_indent = len(before) - before.rfind(b"\n") - 1 - len(b'"examples": ')
+    pad = b"\n" + b" " * (key_indent + 2)
+
+    with open(output_path, "wb") as f:
+        f.write(before + b"[")
+        sep = pad
+        for ex in examples:
+            f.write(sep)
+            f.write(dump_report(ex).replace(b"\n", pad))
+            sep = b"," + pad
+        f.write(pad[:-2] + b"]" + after)
+
+
 def find_all_files_by_role(directory: Path, pattern: str) -> List[Path]:
     """
     Find ALL files matching glob pattern. Sort lexicographically for determinism.
@@ -234,23 +643,108 @@ def find_all_files_by_role(directory: Path, pattern: str) -> List[Path]:
     return candidates
 
 
-def load_all_normalized_items(directory: Path) -> List[Dict[str, Any]]:
+def iter_all_normalized_items(directory: Path) -> Iterator[Dict[str, Any]]:
     """
-    Load ALL *normalized*.jsonl files from directory, concatenating records.
-    Files are processed in lexicographic order for determinism.
+    Stream ALL *normalized*.jsonl files from directory, concatenating records.
+    Files are processed in lexicographic order for determinism. Only one
+    record is held at a time; per-file counts are logged as each file ends.
     """
     files = find_all_files_by_role(directory, "*normalized*.jsonl")
     if not files:
         fail("No normalized items files found in intermediate_dir")
     
-    all_items: List[Dict[str, Any]] = []
     for f in files:
         log(f"  Loading: {f.name}")
-        items = load_jsonl(f)
-        log(f"    -> {len(items)} records")
-        all_items.extend(items)
-    
-    return all_items
+        n = 0
+        for item in iter_jsonl(f):
+            n += 1
+            yield item
+        log(f"    -> {n} records")
+
+
+# Byte-range shards for parallel scanning: one per SHARD_BYTES of input, so a
+# single large normalized file still spreads across workers.
+SHARD_BYTES = 16 << 20
+
+# Topic assignments, inherited copy-on-write by forked scan workers.
+_TOPIC_ASSIGNMENTS: Dict[str, str] = {}
+
+
+def iter_jsonl_range(path: Path, start: int, end: int) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the JSONL records whose line starts at a byte offset in [start, end).
+    Adjacent ranges therefore cover every line of the file exactly once.
+    """
+    with open_sequential(path) as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()  # finish the line straddling `start`; it belongs to the previous range
+        pos = f.tell()
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            line = line.strip()
+            if line:
+                yield _loads(line)
+
+
+def _scan_shard(path: Path, start: int, end: int, counts_only: bool) -> Tuple[int, Dict[str, int], List[tuple]]:
+    n = 0
+
+    def counted() -> Iterator[Dict[str, Any]]:
+        nonlocal n
+        for item in iter_jsonl_range(path, start, end):
+            n += 1
+            yield item
+
+    categories, examples = scan_self_portrayal_claims(counted(), _TOPIC_ASSIGNMENTS, counts_only)
+    # Plain tuples back to the parent: no pickling of this script's classes
+    return n, categories, [tuple(ex) for ex in examples]
+
+
+def detect_self_portrayal_claims_parallel(
+    files: List[Path],
+    topic_assignments: Dict[str, str],
+    workers: int,
+    counts_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    detect_self_portrayal_claims over ALL files, scanned as byte-range shards
+    on forked worker processes. Shard results are merged in file/offset order,
+    so the (first-wins) example dedup and the output are identical to the
+    sequential scan.
+    """
+    shards = []
+    for f in files:
+        size = f.stat().st_size
+        for start in range(0, max(size, 1), SHARD_BYTES):
+            shards.append((f, start, min(start + SHARD_BYTES, size)))
+
+    global _TOPIC_ASSIGNMENTS
+    _TOPIC_ASSIGNMENTS = topic_assignments
+    try:
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards)), mp_context=ctx) as ex:
+            results = list(ex.map(_scan_shard, *zip(*shards), repeat(counts_only)))
+    finally:
+        _TOPIC_ASSIGNMENTS = {}
+
+    categories: Dict[str, int] = {cat: 0 for cat in SELF_PORTRAYAL_CATEGORIES}
+    examples: List[Example] = []
+    per_file: Dict[Path, int] = {f: 0 for f in files}
+    for (f, _, _), (n, cats, exs) in zip(shards, results):
+        per_file[f] += n
+        for cat, c in cats.items():
+            categories[cat] += c
+        examples.extend(Example._make(t) for t in exs)
+
+    for f in files:
+        log(f"  Loaded: {f.name}")
+        log(f"    -> {per_file[f]} records")
+
+    return build_self_portrayal(categories, examples)
 
 
 def find_file_by_role(directory: Path, pattern: str) -> Optional[Path]:
@@ -284,6 +778,22 @@ def main() -> None:
         default="docs/data/report.step5.json",
         help="Step 5 enriched report output path"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for the self-portrayal scan (1 = sequential streaming)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Neither read nor write the {CACHE_DIRNAME} artifacts in intermediate_dir"
+    )
+    parser.add_argument(
+        "--counts-only",
+        action="store_true",
+        help="Only count self-portrayal claims: self_portrayal.examples is written empty"
+    )
     args = parser.parse_args()
     
     log("Starting Step 5: Analysis Enrichment")
@@ -315,20 +825,30 @@ def main() -> None:
     log(f"Loading Step 4 output: {report_path}")
     report = load_json(report_path)
     
-    # Load ALL normalized items (from all matching files, concatenated)
-    log(f"Loading normalized items from: {intermediate_dir}")
-    normalized_items = load_all_normalized_items(intermediate_dir)
-    log(f"  Total loaded: {len(normalized_items)} items")
+    cache_dir = None if args.no_cache else intermediate_dir / CACHE_DIRNAME
     
-    # Build topic assignments
+    # Build topic assignments (only examples carry a topic)
     topic_assignments: Dict[str, str] = {}
-    if topics_path:
+    if topics_path and not args.counts_only:
         log(f"Loading topic assignments: {topics_path}")
-        topic_assignments = build_topic_assignments(topics_path)
+        topic_assignments = load_topic_assignments(topics_path, cache_dir)
+    
+    # Before any worker forks, so they all inherit the gate
+    load_hyperscan_gate(cache_dir)
     
-    # Compute self-portrayal claims
+    # Compute self-portrayal claims over ALL normalized items (from all
+    # matching files, concatenated): sharded across forked workers when more
+    # than one is allowed, else streamed straight through the detector
     log("Computing self-portrayal claims...")
-    self_portrayal = detect_self_portrayal_claims(normalized_items, topic_assignments)
+    log(f"Streaming normalized items from: {intermediate_dir}")
+    if args.workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+        files = find_all_files_by_role(intermediate_dir, "*normalized*.jsonl")
+        self_portrayal = detect_self_portrayal_claims_parallel(
+            files, topic_assignments, args.workers, args.counts_only
+        )
+    else:
+        normalized_items = iter_all_normalized_items(intermediate_dir)
+        self_portrayal = detect_self_portrayal_claims(normalized_items, topic_assignments, args.counts_only)
     log(f"  Total claims: {self_portrayal['total_claims']}")
     log(f"  Examples: {len(self_portrayal['examples'])}")
     
@@ -340,8 +860,7 @@ def main() -> None:
     # Write enriched report to NEW file (Step 4 output stays untouched)
     # sort_keys=True required for deterministic output
     log(f"Writing enriched report: {output_path}")
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False, sort_keys=True)
+    write_report(report, output_path)
     
     log("Step 5A complete (self_portrayal)")
 